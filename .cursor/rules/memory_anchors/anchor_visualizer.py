@@ -17,11 +17,103 @@ Why:
 import argparse
 import json
 import os
+from operator import itemgetter
 from pathlib import Path
+from string import Template
 import networkx as nx
 import matplotlib.pyplot as plt
 import yaml
-from pyvis.network import Network
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# Anchor types shown by default when a graph is too large to show everything
+DEFAULT_PRIORITY_TYPES = ('core', 'config', 'algorithmic')
+PRIORITY_THRESHOLD = 500
+
+# Every node gets all of these attributes in build_graph, so the render
+# loops can unpack them with a single itemgetter call instead of .get()
+NODE_ATTRS = ('file', 'type', 'description', 'line', 'context', 'visible_default')
+get_node_attrs = itemgetter(*NODE_ATTRS)
+
+# Static graphs above these sizes label only the best-connected anchors
+# and render at a lower resolution (savefig time grows with dpi squared)
+MAX_LABELS = 200
+LABEL_FRACTION = 0.02
+LOW_DPI_THRESHOLD = 2000
+
+# Physics options for better visualization of the interactive graph
+INTERACTIVE_GRAPH_OPTIONS = {
+    "physics": {
+        "forceAtlas2Based": {
+            "gravitationalConstant": -50,
+            "centralGravity": 0.01,
+            "springLength": 100,
+            "springConstant": 0.08
+        },
+        "maxVelocity": 50,
+        "solver": "forceAtlas2Based",
+        "timestep": 0.35,
+        "stabilization": {
+            "enabled": True,
+            "iterations": 1000
+        }
+    }
+}
+
+# Standalone vis-network page; data blobs are substituted in one pass
+INTERACTIVE_HTML_TEMPLATE = Template("""<!DOCTYPE html>
+<html>
+<head>
+<meta charset="utf-8">
+<title>Memory Anchors</title>
+<script src="https://unpkg.com/vis-network@9.1.9/standalone/umd/vis-network.min.js"></script>
+<style>
+  #anchor-filters { font-family: sans-serif; font-size: 14px; margin-bottom: 8px; }
+  #anchor-network { width: 100%; height: 800px; border: 1px solid lightgray; }
+</style>
+</head>
+<body>
+<div id="anchor-filters"></div>
+<div id="anchor-network"></div>
+<script>
+  var nodes = new vis.DataSet($nodes);
+  var edges = new vis.DataSet($edges);
+  var container = document.getElementById("anchor-network");
+  var network = new vis.Network(container, {nodes: nodes, edges: edges}, $options);
+
+  // One toggle per anchor type; hidden types are revealed on demand
+  var filters = document.getElementById("anchor-filters");
+  $types.forEach(function (entry) {
+    var label = document.createElement("label");
+    var box = document.createElement("input");
+    box.type = "checkbox";
+    box.checked = entry[1];
+    box.addEventListener("change", function () {
+      var matching = nodes.get({filter: function (n) { return n.anchorType === entry[0]; }});
+      nodes.update(matching.map(function (n) { return {id: n.id, hidden: !box.checked}; }));
+    });
+    label.appendChild(box);
+    label.appendChild(document.createTextNode(" " + entry[0] + " "));
+    filters.appendChild(label);
+  });
+</script>
+</body>
+</html>
+""")
+
+
+def _dumps_for_script(data):
+    """Serialize data to JSON that is safe to embed in a <script> block."""
+    if ORJSON_AVAILABLE:
+        text = orjson.dumps(data).decode('utf-8')
+    else:
+        text = json.dumps(data, separators=(',', ':'))
+    return text.replace('</', '<\\/')
+
 
 class AnchorVisualizer:
     """Generates visualizations of memory anchors."""
@@ -53,34 +145,44 @@ class AnchorVisualizer:
             print(f"Error loading anchors: {e}")
             return []
     
-    def build_graph(self, anchors, group_by_type=True):
-        """Build a graph from memory anchors."""
+    def build_graph(self, anchors, group_by_type=True, priority_types=DEFAULT_PRIORITY_TYPES,
+                    priority_threshold=PRIORITY_THRESHOLD):
+        """Build a graph from memory anchors.
+        
+        When there are more than priority_threshold anchors, only anchors
+        whose type is in priority_types are marked visible by default.
+        """
         # Clear existing graph
         self.graph.clear()
         
+        limit_visible = len(anchors) > priority_threshold
+        priority_set = frozenset(priority_types)
+        
         # Process each anchor
+        add_node = self.graph.add_node
         for anchor in anchors:
             file_path = anchor.get('file', '')
             anchor_type = anchor.get('type', 'unknown')
             description = anchor.get('description', '')
+            line = anchor.get('line', 0)
             
             # Create a unique node ID
-            node_id = f"{file_path}:{anchor.get('line', 0)}"
+            node_id = f"{file_path}:{line}"
             
-            # Add node with attributes
-            self.graph.add_node(node_id, 
-                               file=file_path,
-                               type=anchor_type,
-                               description=description,
-                               line=anchor.get('line', 0),
-                               context=anchor.get('context', ''))
+            # Add node with attributes (always all of NODE_ATTRS)
+            add_node(node_id, 
+                     file=file_path,
+                     type=anchor_type,
+                     description=description,
+                     line=line,
+                     context=anchor.get('context', ''),
+                     visible_default=not limit_visible or anchor_type in priority_set)
         
         # Connect anchors of the same type
         if group_by_type:
             # Group nodes by type
             nodes_by_type = {}
-            for node, attrs in self.graph.nodes(data=True):
-                anchor_type = attrs.get('type', 'unknown')
+            for node, anchor_type in self.graph.nodes(data='type'):
                 if anchor_type not in nodes_by_type:
                     nodes_by_type[anchor_type] = []
                 nodes_by_type[anchor_type].append(node)
@@ -94,12 +196,33 @@ class AnchorVisualizer:
         if self.verbose:
             print(f"Built graph with {self.graph.number_of_nodes()} nodes and {self.graph.number_of_edges()} edges")
     
-    def generate_matplotlib_graph(self, output_file, layout='spring'):
-        """Generate a static graph visualization using matplotlib."""
+    def generate_matplotlib_graph(self, output_file, layout='spring', color_by_type=True):
+        """Generate a static graph visualization using matplotlib.
+        
+        When color_by_type is False all nodes share a single color and no
+        type legend is drawn.
+        """
         if self.graph.number_of_nodes() == 0:
             print("Error: Graph is empty")
             return
         
+        # Only draw anchors visible by default; static output can't reveal the rest
+        graph = self.graph
+        visible = [node for node, shown in graph.nodes(data='visible_default', default=True) if shown]
+        if len(visible) < graph.number_of_nodes():
+            print(f"Large graph: showing {len(visible)} of {graph.number_of_nodes()} anchors "
+                  f"(priority types only)")
+            graph = graph.subgraph(visible)
+        
+        # Label only the highest-degree anchors when there are too many to read
+        node_count = graph.number_of_nodes()
+        if node_count > MAX_LABELS:
+            label_count = min(MAX_LABELS, int(LABEL_FRACTION * node_count))
+            degrees = sorted(graph.degree(), key=lambda item: item[1], reverse=True)
+            labeled = {node for node, _ in degrees[:label_count]}
+        else:
+            labeled = None
+        
         # Create figure
         plt.figure(figsize=(12, 10))
         
@@ -108,137 +231,145 @@ class AnchorVisualizer:
         node_sizes = []
         node_labels = {}
         
-        # Get unique anchor types
-        anchor_types = set()
-        for _, attrs in self.graph.nodes(data=True):
-            anchor_types.add(attrs.get('type', 'unknown'))
+        # File names repeat across anchors, so resolve each path only once
+        name_cache = {}
         
-        # Create a color map for anchor types
-        color_map = plt.cm.get_cmap('tab10', len(anchor_types))
-        type_to_color = {t: color_map(i) for i, t in enumerate(anchor_types)}
+        def basename(path, _cache=name_cache, _basename=os.path.basename):
+            name = _cache.get(path)
+            if name is None:
+                name = _cache[path] = _basename(path)
+            return name
         
-        for node, attrs in self.graph.nodes(data=True):
+        # Color map for anchor types, assigned as types are discovered
+        color_map = plt.get_cmap('tab10')
+        default_color = color_map(0)
+        type_to_color = {}
+        
+        for node, attrs in graph.nodes(data=True):
+            file_path, anchor_type, description, _, _, _ = get_node_attrs(attrs)
+            
             # Set node color based on anchor type
-            anchor_type = attrs.get('type', 'unknown')
-            node_colors.append(type_to_color[anchor_type])
+            if color_by_type:
+                color = type_to_color.get(anchor_type)
+                if color is None:
+                    color = color_map(len(type_to_color) % color_map.N)
+                    type_to_color[anchor_type] = color
+            else:
+                color = default_color
+            node_colors.append(color)
             
             # Set node size
             node_sizes.append(100)
             
             # Set node label (file name and description)
-            file_name = Path(attrs.get('file', '')).name
-            description = attrs.get('description', '')
-            node_labels[node] = f"{file_name}\n{description}"
+            if labeled is None or node in labeled:
+                node_labels[node] = f"{basename(file_path)}\n{description}"
         
         # Choose layout
         if layout == 'spring':
-            pos = nx.spring_layout(self.graph)
+            pos = nx.spring_layout(graph)
         elif layout == 'circular':
-            pos = nx.circular_layout(self.graph)
+            pos = nx.circular_layout(graph)
         elif layout == 'shell':
-            pos = nx.shell_layout(self.graph)
+            pos = nx.shell_layout(graph)
         elif layout == 'spectral':
-            pos = nx.spectral_layout(self.graph)
+            pos = nx.spectral_layout(graph)
         else:
-            pos = nx.spring_layout(self.graph)
+            pos = nx.spring_layout(graph)
         
         # Draw graph
-        nx.draw_networkx_nodes(self.graph, pos, node_color=node_colors, node_size=node_sizes, alpha=0.8)
-        nx.draw_networkx_edges(self.graph, pos, alpha=0.5)
-        nx.draw_networkx_labels(self.graph, pos, labels=node_labels, font_size=8, font_family='sans-serif')
+        nx.draw_networkx_nodes(graph, pos, node_color=node_colors, node_size=node_sizes, alpha=0.8)
+        nx.draw_networkx_edges(graph, pos, alpha=0.5)
+        nx.draw_networkx_labels(graph, pos, labels=node_labels, font_size=8, font_family='sans-serif')
         
         # Add legend for anchor types
-        legend_elements = [plt.Line2D([0], [0], marker='o', color='w', 
-                                     label=anchor_type,
-                                     markerfacecolor=type_to_color[anchor_type], 
-                                     markersize=10)
-                          for anchor_type in anchor_types]
-        
-        plt.legend(handles=legend_elements, title="Anchor Types")
+        if color_by_type:
+            legend_elements = [plt.Line2D([0], [0], marker='o', color='w', 
+                                         label=anchor_type,
+                                         markerfacecolor=type_to_color[anchor_type], 
+                                         markersize=10)
+                              for anchor_type in type_to_color]
+            
+            plt.legend(handles=legend_elements, title="Anchor Types")
         
         # Remove axis
         plt.axis('off')
         
         # Save figure
         plt.tight_layout()
-        plt.savefig(output_file, dpi=300, bbox_inches='tight')
+        dpi = 150 if node_count > LOW_DPI_THRESHOLD else 300
+        plt.savefig(output_file, dpi=dpi, bbox_inches='tight')
         plt.close()
         
         print(f"Static graph saved to {output_file}")
     
-    def generate_interactive_graph(self, output_file):
-        """Generate an interactive graph visualization using pyvis."""
+    def generate_interactive_graph(self, output_file, color_by_type=True):
+        """Generate an interactive graph visualization using vis-network.
+        
+        Node and edge data are serialized once into a single HTML page
+        rather than added one by one through a Python wrapper.
+        When color_by_type is False all nodes share a single color.
+        """
         if self.graph.number_of_nodes() == 0:
             print("Error: Graph is empty")
             return
         
-        # Create network
-        net = Network(height="800px", width="100%", notebook=False)
+        # File names repeat across anchors, so resolve each path only once
+        name_cache = {}
         
-        # Get unique anchor types
-        anchor_types = set()
-        for _, attrs in self.graph.nodes(data=True):
-            anchor_types.add(attrs.get('type', 'unknown'))
+        def basename(path, _cache=name_cache, _basename=os.path.basename):
+            name = _cache.get(path)
+            if name is None:
+                name = _cache[path] = _basename(path)
+            return name
         
-        # Create a color map for anchor types
+        # Color map for anchor types, assigned as types are discovered
         colors = ["#1f77b4", "#ff7f0e", "#2ca02c", "#d62728", "#9467bd", 
                  "#8c564b", "#e377c2", "#7f7f7f", "#bcbd22", "#17becf"]
-        type_to_color = {t: colors[i % len(colors)] for i, t in enumerate(anchor_types)}
+        type_to_color = {}
+        type_visible = {}
         
-        # Add nodes
+        # Build node payload
+        nodes_payload = []
+        append_node = nodes_payload.append
         for node, attrs in self.graph.nodes(data=True):
             # Get attributes
-            file_path = attrs.get('file', '')
-            file_name = Path(file_path).name
-            anchor_type = attrs.get('type', 'unknown')
-            description = attrs.get('description', '')
-            line = attrs.get('line', 0)
-            context = attrs.get('context', '')
-            
-            # Create label
-            label = f"{file_name}:{line}\n{description}"
-            
-            # Create title (tooltip)
-            title = f"File: {file_path}\nLine: {line}\nType: {anchor_type}\nDescription: {description}\nContext: {context}"
-            
-            # Add node
-            net.add_node(node, 
-                        label=label, 
-                        title=title, 
-                        color=type_to_color[anchor_type],
-                        shape='dot',
-                        size=10)
-        
-        # Add edges
-        for source, target, attrs in self.graph.edges(data=True):
-            edge_type = attrs.get('type', '')
+            file_path, anchor_type, description, line, context, shown = get_node_attrs(attrs)
+            file_name = basename(file_path)
+            if color_by_type:
+                color = type_to_color.get(anchor_type)
+                if color is None:
+                    color = colors[len(type_to_color) % len(colors)]
+                    type_to_color[anchor_type] = color
+            else:
+                color = colors[0]
+            type_visible[anchor_type] = type_visible.get(anchor_type, False) or shown
             
-            # Add edge
-            net.add_edge(source, target, title=edge_type)
+            append_node({
+                'id': node,
+                'label': f"{file_name}:{line}\n{description}",
+                'title': f"File: {file_path}\nLine: {line}\nType: {anchor_type}\nDescription: {description}\nContext: {context}",
+                'color': color,
+                'shape': 'dot',
+                'size': 10,
+                'hidden': not shown,
+                'anchorType': anchor_type,
+            })
         
-        # Set physics options for better visualization
-        net.set_options("""
-        {
-          "physics": {
-            "forceAtlas2Based": {
-              "gravitationalConstant": -50,
-              "centralGravity": 0.01,
-              "springLength": 100,
-              "springConstant": 0.08
-            },
-            "maxVelocity": 50,
-            "solver": "forceAtlas2Based",
-            "timestep": 0.35,
-            "stabilization": {
-              "enabled": true,
-              "iterations": 1000
-            }
-          }
-        }
-        """)
+        # Build edge payload
+        edges_payload = [{'from': source, 'to': target, 'title': attrs.get('type', '')}
+                         for source, target, attrs in self.graph.edges(data=True)]
         
         # Save to HTML file
-        net.save_graph(output_file)
+        html = INTERACTIVE_HTML_TEMPLATE.substitute(
+            nodes=_dumps_for_script(nodes_payload),
+            edges=_dumps_for_script(edges_payload),
+            options=_dumps_for_script(INTERACTIVE_GRAPH_OPTIONS),
+            # Types are sorted by name; an anchor's type may be null
+            types=_dumps_for_script(sorted(type_visible.items(), key=lambda item: str(item[0]))),
+        )
+        with open(output_file, 'w', encoding='utf-8') as f:
+            f.write(html)
         
         print(f"Interactive graph saved to {output_file}")
 
@@ -247,8 +378,14 @@ def main():
     parser.add_argument("anchor_file", help="Memory anchor file (JSON or YAML)")
     parser.add_argument("--output-dir", default="anchor_visualizations", help="Output directory")
     parser.add_argument("--static", action="store_true", help="Generate static graph (matplotlib)")
-    parser.add_argument("--interactive", action="store_true", help="Generate interactive graph (pyvis)")
+    parser.add_argument("--interactive", action="store_true", help="Generate interactive graph (vis-network HTML)")
     parser.add_argument("--group-by-type", action="store_true", help="Group anchors by type")
+    parser.add_argument("--priority-types", default=",".join(DEFAULT_PRIORITY_TYPES),
+                        help="Comma-separated anchor types shown by default for large graphs")
+    parser.add_argument("--priority-threshold", type=int, default=PRIORITY_THRESHOLD,
+                        help="Anchor count above which only priority types are shown by default")
+    parser.add_argument("--no-color-by-type", dest="color_by_type", action="store_false",
+                        help="Use a single color for all anchors")
     parser.add_argument("--layout", choices=["spring", "circular", "shell", "spectral"], 
                         default="spring", help="Layout for static graph")
     parser.add_argument("--verbose", action="store_true", help="Enable verbose output")
@@ -265,16 +402,21 @@ def main():
     anchors = visualizer.load_anchors(args.anchor_file)
     
     # Build graph
-    visualizer.build_graph(anchors, group_by_type=args.group_by_type)
+    priority_types = [t.strip() for t in args.priority_types.split(",") if t.strip()]
+    visualizer.build_graph(anchors, group_by_type=args.group_by_type,
+                           priority_types=priority_types,
+                           priority_threshold=args.priority_threshold)
     
     # Generate outputs
     if args.static or not args.interactive:  # Default to static if nothing specified
         static_output = output_dir / "anchor_graph.png"
-        visualizer.generate_matplotlib_graph(static_output, layout=args.layout)
+        visualizer.generate_matplotlib_graph(static_output, layout=args.layout,
+                                             color_by_type=args.color_by_type)
     
     if args.interactive:
         interactive_output = output_dir / "anchor_graph.html"
-        visualizer.generate_interactive_graph(interactive_output)
+        visualizer.generate_interactive_graph(interactive_output,
+                                              color_by_type=args.color_by_type)
 
 if __name__ == "__main__":
     main() 
\ No newline at end of file
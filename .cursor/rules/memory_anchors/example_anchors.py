@@ -15,8 +15,10 @@ Why:
 """
 
 import os
+import copy
 import json
 import logging
+import functools
 from typing import Dict, List, Optional, Union, Any
 
 # Configure logging
@@ -24,6 +26,16 @@ logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 
+@functools.lru_cache(maxsize=16)
+def _read_config(config_path: str, mtime_ns: int) -> Dict[str, Any]:
+    """Parse a JSON config file, cached per path and modification time.
+    
+    mtime_ns is only part of the cache key, so an edited file is read again.
+    """
+    with open(config_path, 'r') as f:
+        return json.load(f)
+
+
 # MEMORY_ANCHOR: {core} data_processing_pipeline
 class DataProcessor:
     """Main data processing pipeline.
@@ -45,8 +57,10 @@ class DataProcessor:
     def _load_config(self, config_path: str) -> Dict[str, Any]:
         """Load configuration from a JSON file."""
         try:
-            with open(config_path, 'r') as f:
-                return json.load(f)
+            # Deep copy so no processor can change the shared cached config,
+            # nested values included
+            mtime_ns = os.stat(config_path).st_mtime_ns
+            return copy.deepcopy(_read_config(config_path, mtime_ns))
         except Exception as e:
             logger.error("Failed to load config: %s", str(e))
             return {}
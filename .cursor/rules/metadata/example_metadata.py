@@ -32,6 +32,7 @@ metadata = processor.extract_metadata('source_file.py')
 
 import json
 import os
+import re
 import logging
 from typing import Dict, List, Any, Optional
 
@@ -220,6 +221,19 @@ class MetadataValidator:
         @param rules Dictionary containing validation rules
         """
         self.rules = rules
+        
+        # Pre-build lookup structures so validate() does no setup work
+        self._required_fields = tuple(rules.get('required_fields', []))
+        self._required_set = frozenset(self._required_fields)
+        
+        # Compile the 'formats' patterns once for format checks; a pattern
+        # that does not compile is logged and left out
+        self._format_res = {}
+        for field, pattern in rules.get('formats', {}).items():
+            try:
+                self._format_res[field] = re.compile(pattern)
+            except re.error as e:
+                logger.warning(f"Ignoring invalid format pattern for field {field}: {e}")
     
     def validate(self, metadata: Dict[str, Any]) -> List[str]:
         """
@@ -231,11 +245,13 @@ class MetadataValidator:
         """
         errors = []
         
-        # Check required fields
-        required_fields = self.rules.get('required_fields', [])
-        for field in required_fields:
-            if field not in metadata:
-                errors.append(f"Missing required field: {field}")
+        # Check required fields (reported in the configured order)
+        missing = self._required_set.difference(metadata)
+        if missing:
+            errors.extend(
+                f"Missing required field: {field}"
+                for field in self._required_fields if field in missing
+            )
         
         # Check field formats
         # In a real implementation, we would have more sophisticated validation
@@ -15,6 +15,10 @@ to display metadata coverage, quality, and trends from extraction reports.
 @example
 ```bash
 python metadata_dashboard.py --report ./metadata-output/metadata_report_20231125_120000.json
+
+# Production: serve the module-level WSGI app with gunicorn
+METADATA_DASHBOARD_REPORT=./metadata-output/metadata_report_20231125_120000.json \
+    gunicorn -w 4 -k gevent metadata_dashboard:server
 ```
 
 @dependencies
@@ -24,26 +28,67 @@ python metadata_dashboard.py --report ./metadata-output/metadata_report_20231125
 - json
 - argparse
 - os
+- orjson (optional, faster report parsing)
+- ijson (optional, streaming for very large reports)
+- flask-caching (optional, caches parsed reports and prepared data)
+- diskcache (optional, background table updates for very large reports)
+- flask-compress (optional, brotli/gzip compression of responses)
 """
 
 import os
 import json
+import random
 import argparse
 import logging
+import tempfile
+from collections import Counter
 from datetime import datetime
 from typing import Dict, List, Any, Optional, Tuple
 
 try:
+    import numpy as np
     import pandas as pd
-    import plotly.express as px
-    import plotly.graph_objects as go
-    from dash import Dash, html, dcc, callback, Output, Input
+    from flask import Flask, request
+    from dash import Dash, html, dcc, dash_table, callback, Output, Input
+    from dash.dash_table.Format import Format, Symbol
     DEPENDENCIES_AVAILABLE = True
 except ImportError:
     DEPENDENCIES_AVAILABLE = False
     print("Warning: Dashboard dependencies not available. Please install with:")
     print("pip install dash plotly pandas")
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+try:
+    import ijson
+    from ijson.common import ObjectBuilder
+    IJSON_AVAILABLE = True
+except ImportError:
+    IJSON_AVAILABLE = False
+
+try:
+    from flask_caching import Cache
+    FLASK_CACHING_AVAILABLE = True
+except ImportError:
+    FLASK_CACHING_AVAILABLE = False
+
+try:
+    import diskcache
+    from dash import DiskcacheManager
+    DISKCACHE_AVAILABLE = True
+except ImportError:
+    DISKCACHE_AVAILABLE = False
+
+try:
+    from flask_compress import Compress
+    FLASK_COMPRESS_AVAILABLE = True
+except ImportError:
+    FLASK_COMPRESS_AVAILABLE = False
+
 # Configure logging
 logging.basicConfig(
     level=logging.INFO,
@@ -52,6 +97,52 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Static files (dashboard.css) are served from this folder next to the script
+ASSETS_FOLDER = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'assets')
+ASSETS_MAX_AGE = 86400
+
+# Layout and callback payloads are compressed with brotli where the browser
+# accepts it, falling back to gzip. The file table is virtualized as well,
+# so the browser only renders the visible rows.
+COMPRESS_ALGORITHM = ['br', 'gzip']
+
+# Environment variable naming the report served by the module-level `server`
+REPORT_ENV_VAR = 'METADATA_DASHBOARD_REPORT'
+
+# Let graphs resize with their containers
+GRAPH_CONFIG = {'responsive': True}
+
+# Constant uirevision keeps zoom/legend state when a figure is re-sent
+UI_REVISION = 'const'
+
+# Parsed reports and prepared DataFrames are cached across runs, keyed on
+# the report path and modification time
+DEFAULT_CACHE_CONFIG = {
+    'CACHE_TYPE': 'FileSystemCache',
+    'CACHE_DIR': os.path.join(tempfile.gettempdir(), 'metadata_dashboard_cache'),
+    'CACHE_DEFAULT_TIMEOUT': 3600
+}
+
+# Reports larger than this are stream-parsed (when ijson is installed),
+# keeping only a random sample of the per-file results in memory
+STREAMING_THRESHOLD_BYTES = 100 * 1024 * 1024
+STREAMED_FILE_SAMPLE_SIZE = 10000
+
+# With more files than this the table callback runs as a background job,
+# so a newer slider position supersedes an in-flight update
+BACKGROUND_CALLBACK_ROWS = 50000
+BACKGROUND_CACHE_DIR = os.path.join(tempfile.gettempdir(), 'metadata_dashboard_jobs')
+
+# Columns shown in the File Details table
+FILE_TABLE_COLUMNS = ['Filename', 'Fields', 'Missing', 'Invalid', 'Completeness', 'Valid']
+
+# Above this many matching files the table shows only the best and worst rows
+MAX_TABLE_ROWS = 2000
+
+# Bar charts show only this many of the largest entries
+MAX_EXTENSIONS = 30
+MAX_MISSING_FIELDS = 25
+
 
 class MetadataDashboard:
     """
@@ -66,19 +157,37 @@ class MetadataDashboard:
     @author MetadataTeam
     """
     
-    def __init__(self, report_path: str):
+    def __init__(self, report_path: str, cache_config: Optional[Dict[str, Any]] = None):
         """
         @method __init__
         @description Initialize the dashboard with a report
         
         @param report_path Path to the metadata extraction report (JSON)
+        @param cache_config Flask-Caching configuration; defaults to a
+               filesystem cache, pass {'CACHE_TYPE': 'NullCache'} to disable
         """
         if not DEPENDENCIES_AVAILABLE:
             raise ImportError("Required dependencies not available. Please install dash, plotly, and pandas.")
         
         self.report_path = report_path
-        self.report_data = self._load_report(report_path)
+        self.server = Flask(__name__)
+        if FLASK_COMPRESS_AVAILABLE:
+            self.server.config['COMPRESS_ALGORITHM'] = COMPRESS_ALGORITHM
+            Compress(self.server)
+        self.cache = None
+        if FLASK_CACHING_AVAILABLE:
+            self.cache = Cache(self.server, config=cache_config or DEFAULT_CACHE_CONFIG)
+        self.report_data = self._cached('report', lambda: self._load_report(report_path))
         self.app = None
+        self._prepared: Dict[str, pd.DataFrame] = {}
+        self._neg_completeness: Optional[np.ndarray] = None
+        self._figures: Optional[Dict[str, Dict[str, Any]]] = None
+        
+        # Format the report timestamp once; keep it as-is if it is not ISO 8601
+        try:
+            self._timestamp_str = datetime.fromisoformat(self.report_data['timestamp']).strftime('%Y-%m-%d %H:%M:%S')
+        except Exception:
+            self._timestamp_str = self.report_data.get('timestamp', 'unknown')
         
         logger.info(f"Initialized MetadataDashboard with report from {report_path}")
     
@@ -93,14 +202,124 @@ class MetadataDashboard:
         @private
         """
         try:
-            with open(report_path, 'r') as f:
-                data = json.load(f)
+            if IJSON_AVAILABLE and os.path.getsize(report_path) > STREAMING_THRESHOLD_BYTES:
+                return self._load_report_streaming(report_path)
+            
+            with open(report_path, 'rb') as f:
+                buf = f.read()
+            data = orjson.loads(buf) if ORJSON_AVAILABLE else json.loads(buf)
             logger.info(f"Loaded report from {report_path}")
             return data
         except Exception as e:
             logger.error(f"Failed to load report: {str(e)}")
             raise
     
+    def _load_report_streaming(self, report_path: str,
+                               sample_size: int = STREAMED_FILE_SAMPLE_SIZE) -> Dict[str, Any]:
+        """
+        @method _load_report_streaming
+        @description Stream-parse a large report without materializing it
+        
+        All top-level sections except file_results are loaded as-is.
+        file_results is reduced to a uniform reservoir sample of at most
+        sample_size entries, so peak memory no longer grows with the
+        number of files in the report.
+        
+        @param report_path Path to the report file
+        @param sample_size Maximum number of file results to keep
+        @return Dictionary containing the report data
+        
+        @private
+        """
+        data: Dict[str, Any] = {}
+        sample: List[Tuple[str, Any]] = []
+        rng = random.Random(0)
+        seen = 0
+        
+        depth = 0
+        top_key = None
+        entry_key = None
+        builder = None
+        builder_depth = 0
+        
+        with open(report_path, 'rb') as f:
+            for _, event, value in ijson.parse(f, use_float=True):
+                if event in ('end_map', 'end_array'):
+                    depth -= 1
+                
+                if builder is not None:
+                    # Inside a value that is being materialized
+                    builder.event(event, value)
+                    if depth == builder_depth:
+                        if top_key == 'file_results':
+                            seen += 1
+                            if len(sample) < sample_size:
+                                sample.append((entry_key, builder.value))
+                            else:
+                                slot = rng.randrange(seen)
+                                if slot < sample_size:
+                                    sample[slot] = (entry_key, builder.value)
+                        else:
+                            data[top_key] = builder.value
+                        builder = None
+                elif event == 'map_key':
+                    if depth == 1:
+                        top_key = value
+                    elif depth == 2 and top_key == 'file_results':
+                        entry_key = value
+                elif (depth == 1 and top_key != 'file_results') or (depth == 2 and top_key == 'file_results'):
+                    # Start of a top-level value or of a single file result
+                    if event in ('start_map', 'start_array'):
+                        builder = ObjectBuilder()
+                        builder.event(event, value)
+                        builder_depth = depth
+                    else:
+                        data[top_key] = value
+                
+                if event in ('start_map', 'start_array'):
+                    depth += 1
+        
+        data['file_results'] = dict(sample)
+        logger.info(f"Stream-loaded report from {report_path} "
+                    f"({len(sample)} of {seen} file results sampled)")
+        return data
+    
+    def _cached(self, name: str, compute):
+        """
+        @method _cached
+        @description Return a cached artifact for this report, computing it on a miss
+        
+        @param name Artifact name, unique per report
+        @param compute Callable producing the artifact
+        @return The cached or freshly computed artifact
+        
+        @private
+        """
+        if self.cache is None:
+            return compute()
+        
+        key = f"{os.path.abspath(self.report_path)}:{os.path.getmtime(self.report_path)}:{name}"
+        value = self.cache.get(key)
+        if value is None:
+            value = compute()
+            self.cache.set(key, value)
+        return value
+    
+    def _get_prepared(self, name: str) -> pd.DataFrame:
+        """
+        @method _get_prepared
+        @description Return a prepared DataFrame, building it on first use
+        
+        @param name Data set name, e.g. "file" for _prepare_file_data
+        @return Cached DataFrame for the data set
+        
+        @private
+        """
+        df = self._prepared.get(name)
+        if df is None:
+            df = self._prepared[name] = self._cached(name, getattr(self, f"_prepare_{name}_data"))
+        return df
+    
     def _prepare_summary_data(self) -> pd.DataFrame:
         """
         @method _prepare_summary_data
@@ -134,119 +353,280 @@ class MetadataDashboard:
         """
         by_language = self.report_data['by_language']
         
-        # Create a DataFrame for the language distribution
-        language_data = [
-            {"Language": lang, "Files": count}
-            for lang, count in by_language.items()
-        ]
-        
-        return pd.DataFrame(language_data)
+        # Create a DataFrame for the language distribution, one column at a time
+        return pd.DataFrame({
+            "Language": list(by_language.keys()),
+            "Files": list(by_language.values())
+        })
     
     def _prepare_extension_data(self) -> pd.DataFrame:
         """
         @method _prepare_extension_data
         @description Prepare file extension data for visualization
         
-        @return DataFrame containing file extension distribution
+        @return DataFrame containing the most common file extensions, largest first
         
         @private
         """
         by_extension = self.report_data['by_file_extension']
+        top_extensions = Counter(by_extension).most_common(MAX_EXTENSIONS)
         
-        # Create a DataFrame for the extension distribution
-        extension_data = [
-            {"Extension": f".{ext}", "Files": count}
-            for ext, count in by_extension.items()
-        ]
-        
-        return pd.DataFrame(extension_data)
+        # Create a DataFrame for the extension distribution, one column at a time
+        return pd.DataFrame({
+            "Extension": [f".{ext}" for ext, _ in top_extensions],
+            "Files": [count for _, count in top_extensions]
+        })
     
     def _prepare_missing_fields_data(self) -> pd.DataFrame:
         """
         @method _prepare_missing_fields_data
         @description Prepare missing fields data for visualization
         
-        @return DataFrame containing missing fields
+        @return DataFrame containing the most common missing fields, largest first
         
         @private
         """
         missing_fields = self.report_data['most_common_missing_fields']
+        top_missing = Counter(missing_fields).most_common(MAX_MISSING_FIELDS)
         
-        # Create a DataFrame for the missing fields
-        missing_fields_data = [
-            {"Field": field, "Count": count}
-            for field, count in missing_fields.items()
-        ]
-        
-        return pd.DataFrame(missing_fields_data)
+        # Create a DataFrame for the missing fields, one column at a time
+        return pd.DataFrame({
+            "Field": [field for field, _ in top_missing],
+            "Count": [count for _, count in top_missing]
+        })
     
     def _prepare_file_data(self) -> pd.DataFrame:
         """
         @method _prepare_file_data
         @description Prepare detailed file data for visualization
         
-        @return DataFrame containing file-level data
+        @return DataFrame containing file-level data, sorted by completeness
         
         @private
         """
         file_results = self.report_data['file_results']
+        count = len(file_results)
+        paths = list(file_results)
+        
+        # Collect per-file counts column by column in a single pass; field
+        # counts are small, so narrow integer columns are enough
+        total_fields = np.empty(count, dtype=np.int32)
+        missing_fields = np.empty(count, dtype=np.int32)
+        invalid_fields = np.empty(count, dtype=np.int32)
+        valid = np.empty(count, dtype=bool)
+        
+        for i, data in enumerate(file_results.values()):
+            validation = data['validation']
+            total_fields[i] = len(data['metadata'])
+            missing_fields[i] = len(validation['missing_fields'])
+            invalid_fields[i] = len(validation['invalid_formats'])
+            valid[i] = validation['valid']
+        
+        # Extract filenames from paths in a vectorized pass
+        filenames = pd.Series(paths, dtype=object)
+        for sep in filter(None, (os.sep, os.altsep)):
+            filenames = filenames.str.rpartition(sep)[2]
+        
+        # Calculate completeness score (0-100); int16 keeps sorting and
+        # range lookups on a compact array
+        completeness = np.where(
+            valid, 100, np.clip(100 - (missing_fields + invalid_fields) * 10, 0, 100)
+        ).astype(np.int16)
+        
+        file_df = pd.DataFrame({
+            "Filename": filenames.to_numpy(),
+            "Path": paths,
+            "Fields": total_fields,
+            "Missing": missing_fields,
+            "Invalid": invalid_fields,
+            "Completeness": completeness,
+            "Valid": valid
+        })
+        
+        # Sort once so completeness filters become a contiguous slice
+        return file_df.sort_values('Completeness', ascending=False, kind='stable', ignore_index=True)
+    
+    def _maybe_downsample(self, df: pd.DataFrame, max_rows: int = MAX_TABLE_ROWS) -> Tuple[pd.DataFrame, Optional[pd.Series]]:
+        """
+        @method _maybe_downsample
+        @description Reduce a completeness-sorted file DataFrame for display
         
-        # Create a DataFrame for the file results
-        file_data = []
+        When df has more than max_rows rows, only the most and least
+        complete files are kept and the remainder is summarized as a count
+        of files per completeness score.
         
-        for path, data in file_results.items():
-            # Extract filename from path
-            filename = os.path.basename(path)
-            
-            # Count total metadata fields
-            total_fields = len(data['metadata'])
-            
-            # Count missing and invalid fields
-            missing_fields = len(data['validation']['missing_fields'])
-            invalid_fields = len(data['validation']['invalid_formats'])
-            
-            # Calculate completeness score (0-100)
-            completeness = 100 if data['validation']['valid'] else (
-                100 - (missing_fields + invalid_fields) * 10
+        @param df File DataFrame sorted by completeness descending
+        @param max_rows Maximum number of rows to return
+        @return Tuple of the rows to display and the per-score file counts,
+                or None for the counts when no rows were dropped
+        
+        @private
+        """
+        if len(df) <= max_rows:
+            return df, None
+        
+        half = max_rows // 2
+        counts = df['Completeness'].value_counts().sort_index(ascending=False)
+        return pd.concat([df.iloc[:half], df.iloc[-half:]]), counts
+    
+    def _gauge_figure(self, title: str, value: float, threshold: float) -> Dict[str, Any]:
+        """
+        @method _gauge_figure
+        @description Build a coverage gauge as a plain figure dict
+        
+        Plain dicts are passed to Dash as-is, skipping the property
+        validation plotly runs when building graph_objects figures.
+        
+        @param title Gauge title
+        @param value Percentage shown on the gauge
+        @param threshold Target percentage marked on the gauge
+        @return Figure dict for dcc.Graph
+        
+        @private
+        """
+        return {
+            "data": [{
+                "type": "indicator",
+                "mode": "gauge+number",
+                "value": value,
+                "title": {"text": title},
+                "gauge": {
+                    "axis": {"range": [0, 100]},
+                    "bar": {"color": "green"},
+                    "steps": [
+                        {"range": [0, 50], "color": "red"},
+                        {"range": [50, 80], "color": "orange"},
+                        {"range": [80, 100], "color": "lightgreen"}
+                    ],
+                    "threshold": {
+                        "line": {"color": "green", "width": 4},
+                        "thickness": 0.75,
+                        "value": threshold
+                    }
+                }
+            }],
+            "layout": {"uirevision": UI_REVISION}
+        }
+    
+    def _bar_figure(self, df: pd.DataFrame, x: str, y: str, title: str, colorscale: str) -> Dict[str, Any]:
+        """
+        @method _bar_figure
+        @description Build a bar chart colored by bar height as a plain figure dict
+        
+        @param df DataFrame holding the bars
+        @param x Column used for the bar categories
+        @param y Column used for the bar heights
+        @param title Chart title
+        @param colorscale Plotly colorscale name
+        @return Figure dict for dcc.Graph
+        
+        @private
+        """
+        values = df[y].tolist()
+        return {
+            "data": [{
+                "type": "bar",
+                "x": df[x].tolist(),
+                "y": values,
+                "marker": {
+                    "color": values,
+                    "colorscale": colorscale,
+                    "showscale": True,
+                    "colorbar": {"title": {"text": y}}
+                }
+            }],
+            "layout": {
+                "title": {"text": title},
+                "xaxis": {"title": {"text": x}, "categoryorder": "trace"},
+                "yaxis": {"title": {"text": y}},
+                "uirevision": UI_REVISION
+            }
+        }
+    
+    def _prepare_figures(self) -> Dict[str, Dict[str, Any]]:
+        """
+        @method _prepare_figures
+        @description Build every dashboard figure as a plain dict
+        
+        @return Dictionary of figure dicts keyed by chart name
+        
+        @private
+        """
+        summary = self.report_data['summary']
+        language_df = self._get_prepared('language')
+        extension_df = self._get_prepared('extension')
+        missing_fields_df = self._get_prepared('missing_fields')
+        
+        return {
+            'coverage': self._gauge_figure(
+                "Metadata Coverage (%)",
+                round(summary['metadata_coverage'], 1),
+                threshold=95
+            ),
+            'complete_coverage': self._gauge_figure(
+                "Complete Metadata Coverage (%)",
+                round(summary['complete_metadata_coverage'], 1),
+                threshold=90
+            ),
+            'language': {
+                "data": [{
+                    "type": "pie",
+                    "values": language_df["Files"].tolist(),
+                    "labels": language_df["Language"].tolist(),
+                    "hole": 0.3
+                }],
+                "layout": {"title": {"text": "Files by Language"}, "uirevision": UI_REVISION}
+            },
+            'extension': self._bar_figure(
+                extension_df, "Extension", "Files",
+                title="Files by Extension",
+                colorscale="Viridis"
+            ),
+            'missing_fields': self._bar_figure(
+                missing_fields_df, "Field", "Count",
+                title="Most Common Missing Fields",
+                colorscale="Reds"
             )
-            completeness = max(0, min(100, completeness))
-            
-            file_data.append({
-                "Filename": filename,
-                "Path": path,
-                "Fields": total_fields,
-                "Missing": missing_fields,
-                "Invalid": invalid_fields,
-                "Completeness": completeness,
-                "Valid": data['validation']['valid']
-            })
-        
-        return pd.DataFrame(file_data)
+        }
     
-    def create_dashboard(self) -> Dash:
+    def _get_figures(self) -> Dict[str, Dict[str, Any]]:
         """
-        @method create_dashboard
-        @description Create the Dash application for the dashboard
+        @method _get_figures
+        @description Return the dashboard figure dicts, building them on first use
         
-        @return Dash application object
+        The dicts are handed to dcc.Graph as-is on every layout build, so
+        each figure is constructed once per report rather than per page load.
+        
+        @return Dictionary of figure dicts keyed by chart name
+        
+        @private
         """
-        # Prepare data for visualizations
-        summary_df = self._prepare_summary_data()
-        language_df = self._prepare_language_data()
-        extension_df = self._prepare_extension_data()
-        missing_fields_df = self._prepare_missing_fields_data()
-        file_df = self._prepare_file_data()
+        if self._figures is None:
+            self._figures = self._cached('figures', self._prepare_figures)
+        return self._figures
+    
+    def _build_layout(self) -> html.Div:
+        """
+        @method _build_layout
+        @description Build the dashboard layout
         
-        # Create the Dash app
-        app = Dash(__name__, title="Metadata Dashboard")
+        Dash calls this on each page load, so nothing is prepared until
+        the dashboard is first requested; prepared data is reused after that.
         
-        # Define layout
-        app.layout = html.Div([
+        @return Root layout component
+        
+        @private
+        """
+        # Prepare data for visualizations
+        summary_df = self._get_prepared('summary')
+        figures = self._get_figures()
+        
+        return html.Div([
             # Header
             html.Div([
                 html.H1("Metadata Dashboard", className="dashboard-title"),
                 html.H3(f"Report: {os.path.basename(self.report_path)}", className="report-title"),
-                html.P(f"Generated on: {datetime.fromisoformat(self.report_data['timestamp']).strftime('%Y-%m-%d %H:%M:%S')}")
+                html.P(f"Generated on: {self._timestamp_str}")
             ], className="header"),
             
             # Summary stats
@@ -256,70 +636,28 @@ class MetadataDashboard:
                     # Coverage gauge
                     html.Div([
                         dcc.Graph(
-                            figure=go.Figure(
-                                go.Indicator(
-                                    mode="gauge+number",
-                                    value=summary_df[summary_df["Metric"] == "Metadata Coverage (%)"]["Value"].iloc[0],
-                                    title={"text": "Metadata Coverage (%)"},
-                                    gauge={
-                                        "axis": {"range": [0, 100]},
-                                        "bar": {"color": "green"},
-                                        "steps": [
-                                            {"range": [0, 50], "color": "red"},
-                                            {"range": [50, 80], "color": "orange"},
-                                            {"range": [80, 100], "color": "lightgreen"}
-                                        ],
-                                        "threshold": {
-                                            "line": {"color": "green", "width": 4},
-                                            "thickness": 0.75,
-                                            "value": 95
-                                        }
-                                    }
-                                )
-                            )
+                            figure=figures['coverage'],
+                            config=GRAPH_CONFIG
                         )
                     ], className="summary-gauge"),
                     
                     # Completeness gauge
                     html.Div([
                         dcc.Graph(
-                            figure=go.Figure(
-                                go.Indicator(
-                                    mode="gauge+number",
-                                    value=summary_df[summary_df["Metric"] == "Complete Metadata Coverage (%)"]["Value"].iloc[0],
-                                    title={"text": "Complete Metadata Coverage (%)"},
-                                    gauge={
-                                        "axis": {"range": [0, 100]},
-                                        "bar": {"color": "green"},
-                                        "steps": [
-                                            {"range": [0, 50], "color": "red"},
-                                            {"range": [50, 80], "color": "orange"},
-                                            {"range": [80, 100], "color": "lightgreen"}
-                                        ],
-                                        "threshold": {
-                                            "line": {"color": "green", "width": 4},
-                                            "thickness": 0.75,
-                                            "value": 90
-                                        }
-                                    }
-                                )
-                            )
+                            figure=figures['complete_coverage'],
+                            config=GRAPH_CONFIG
                         )
                     ], className="summary-gauge")
                 ], className="summary-gauges"),
                 
                 # Summary table
                 html.Div([
-                    html.Table([
-                        html.Thead(
-                            html.Tr([html.Th(col) for col in summary_df.columns])
-                        ),
-                        html.Tbody([
-                            html.Tr([
-                                html.Td(summary_df.iloc[i][col]) for col in summary_df.columns
-                            ]) for i in range(len(summary_df))
-                        ])
-                    ], className="summary-table")
+                    dash_table.DataTable(
+                        data=summary_df.to_dict('records'),
+                        columns=[{"name": col, "id": col} for col in summary_df.columns],
+                        style_cell={"textAlign": "left", "padding": "8px"},
+                        style_header={"backgroundColor": "#f2f2f2", "fontWeight": "bold"}
+                    )
                 ], className="summary-table-container")
             ], className="summary-section"),
             
@@ -328,27 +666,16 @@ class MetadataDashboard:
                 html.Div([
                     html.H2("Language Distribution", className="section-title"),
                     dcc.Graph(
-                        figure=px.pie(
-                            language_df, 
-                            values="Files", 
-                            names="Language",
-                            title="Files by Language",
-                            hole=0.3
-                        )
+                        figure=figures['language'],
+                        config=GRAPH_CONFIG
                     )
                 ], className="chart-container"),
                 
                 html.Div([
                     html.H2("File Extension Distribution", className="section-title"),
                     dcc.Graph(
-                        figure=px.bar(
-                            extension_df,
-                            x="Extension",
-                            y="Files",
-                            title="Files by Extension",
-                            color="Files",
-                            color_continuous_scale="Viridis"
-                        )
+                        figure=figures['extension'],
+                        config=GRAPH_CONFIG
                     )
                 ], className="chart-container")
             ], className="chart-row"),
@@ -357,14 +684,8 @@ class MetadataDashboard:
             html.Div([
                 html.H2("Missing Fields", className="section-title"),
                 dcc.Graph(
-                    figure=px.bar(
-                        missing_fields_df,
-                        x="Field",
-                        y="Count",
-                        title="Most Common Missing Fields",
-                        color="Count",
-                        color_continuous_scale="Reds"
-                    )
+                    figure=figures['missing_fields'],
+                    config=GRAPH_CONFIG
                 )
             ], className="chart-container"),
             
@@ -380,72 +701,113 @@ class MetadataDashboard:
                     marks={i: f'{i}%' for i in range(0, 101, 10)},
                     value=[0, 100]
                 ),
-                html.Div(id='file-table-container')
-            ], className="file-details-section"),
-            
-            # CSS for styling
-            html.Style("""
-                .dashboard-title { color: #2c3e50; text-align: center; margin-bottom: 10px; }
-                .report-title { color: #7f8c8d; text-align: center; margin-top: 0; }
-                .header { padding: 20px; background-color: #f8f9fa; border-bottom: 1px solid #dee2e6; margin-bottom: 20px; }
-                .section-title { color: #2c3e50; border-bottom: 1px solid #eee; padding-bottom: 10px; }
-                .summary-section { margin-bottom: 30px; }
-                .summary-gauges { display: flex; justify-content: space-around; flex-wrap: wrap; }
-                .summary-gauge { width: 45%; min-width: 300px; }
-                .summary-table { width: 100%; border-collapse: collapse; }
-                .summary-table th, .summary-table td { padding: 8px; text-align: left; border-bottom: 1px solid #ddd; }
-                .summary-table th { background-color: #f2f2f2; }
-                .summary-table-container { margin-top: 20px; }
-                .chart-row { display: flex; flex-wrap: wrap; justify-content: space-between; margin-bottom: 30px; }
-                .chart-container { width: 48%; min-width: 450px; margin-bottom: 20px; box-shadow: 0 4px 8px rgba(0,0,0,0.1); padding: 15px; border-radius: 5px; }
-                .file-details-section { margin-top: 30px; }
-                .file-table { width: 100%; border-collapse: collapse; margin-top: 20px; }
-                .file-table th, .file-table td { padding: 8px; text-align: left; border-bottom: 1px solid #ddd; }
-                .file-table th { background-color: #f2f2f2; position: sticky; top: 0; }
-                .file-table-container { height: 400px; overflow-y: auto; margin-top: 20px; }
-                
-                @media (max-width: 992px) {
-                    .chart-container { width: 100%; }
-                    .summary-gauge { width: 100%; }
-                }
-            """)
+                dcc.Checklist(
+                    id='show-all-files',
+                    options=[{'label': ' Show all matching files', 'value': 'all'}],
+                    value=[]
+                ),
+                html.P(id='file-table-count'),
+                dash_table.DataTable(
+                    id='file-table',
+                    columns=[
+                        {"name": col, "id": col, "type": "numeric",
+                         "format": Format(symbol=Symbol.yes, symbol_suffix='%')}
+                        if col == 'Completeness' else {"name": col, "id": col}
+                        for col in FILE_TABLE_COLUMNS
+                    ],
+                    virtualization=True,
+                    page_action='none',
+                    fixed_rows={'headers': True},
+                    sort_action='native',
+                    filter_action='native',
+                    style_table={"height": "400px", "overflowY": "auto"},
+                    style_cell={"textAlign": "left", "padding": "8px", "minWidth": "80px"},
+                    style_header={"backgroundColor": "#f2f2f2", "fontWeight": "bold"}
+                )
+            ], className="file-details-section")
         ])
+    
+    def _filter_file_data(self, low: float, high: float) -> pd.DataFrame:
+        """
+        @method _filter_file_data
+        @description Select files whose completeness lies in [low, high]
+        
+        @param low Lowest completeness to include
+        @param high Highest completeness to include
+        @return Matching rows of the file DataFrame, most complete first
+        
+        @private
+        """
+        file_df = self._get_prepared('file')
+        if self._neg_completeness is None:
+            # file_df is sorted by completeness descending; negate it for searchsorted
+            self._neg_completeness = -file_df['Completeness'].to_numpy()
+        
+        # Already sorted, so the range is a slice
+        start = np.searchsorted(self._neg_completeness, -high, side='left')
+        end = np.searchsorted(self._neg_completeness, -low, side='right')
+        return file_df.iloc[start:end]
+    
+    def create_dashboard(self) -> Dash:
+        """
+        @method create_dashboard
+        @description Create the Dash application for the dashboard
+        
+        The layout and file data are built lazily on the first request.
+        
+        @return Dash application object
+        """
+        file_count = len(self.report_data['file_results'])
+        use_background = DISKCACHE_AVAILABLE and file_count > BACKGROUND_CALLBACK_ROWS
+        background_manager = None
+        if use_background:
+            background_manager = DiskcacheManager(diskcache.Cache(BACKGROUND_CACHE_DIR))
+        
+        # Create the Dash app
+        app = Dash(__name__, server=self.server, title="Metadata Dashboard",
+                   assets_folder=ASSETS_FOLDER,
+                   background_callback_manager=background_manager)
+        
+        # Let browsers reuse the stylesheet instead of refetching it
+        @self.server.after_request
+        def cache_assets(response):
+            if request.path.startswith(app.get_asset_url('')):
+                response.cache_control.no_cache = None
+                response.cache_control.public = True
+                response.cache_control.max_age = ASSETS_MAX_AGE
+            return response
+        
+        # Define layout
+        app.layout = self._build_layout
         
         # Define callback for file table filtering
         @app.callback(
-            Output('file-table-container', 'children'),
-            [Input('completeness-slider', 'value')]
+            [Output('file-table-count', 'children'), Output('file-table', 'data')],
+            [Input('completeness-slider', 'value'), Input('show-all-files', 'value')],
+            background=use_background
         )
-        def update_file_table(completeness_range):
-            filtered_df = file_df[
-                (file_df['Completeness'] >= completeness_range[0]) & 
-                (file_df['Completeness'] <= completeness_range[1])
-            ]
+        def update_file_table(completeness_range, show_all):
+            filtered_df = self._filter_file_data(completeness_range[0], completeness_range[1])
             
-            # Sort by completeness descending
-            filtered_df = filtered_df.sort_values('Completeness', ascending=False)
+            if show_all:
+                display_df, counts = filtered_df, None
+            else:
+                display_df, counts = self._maybe_downsample(filtered_df)
             
-            # Create the table
-            return html.Div([
-                html.P(f"Showing {len(filtered_df)} files"),
-                html.Div([
-                    html.Table([
-                        html.Thead(
-                            html.Tr([html.Th(col) for col in ['Filename', 'Fields', 'Missing', 'Invalid', 'Completeness', 'Valid']])
-                        ),
-                        html.Tbody([
-                            html.Tr([
-                                html.Td(filtered_df.iloc[i]['Filename']),
-                                html.Td(filtered_df.iloc[i]['Fields']),
-                                html.Td(filtered_df.iloc[i]['Missing']),
-                                html.Td(filtered_df.iloc[i]['Invalid']),
-                                html.Td(f"{filtered_df.iloc[i]['Completeness']}%"),
-                                html.Td("✓" if filtered_df.iloc[i]['Valid'] else "✗")
-                            ]) for i in range(len(filtered_df))
-                        ])
-                    ], className="file-table")
-                ], className="file-table-container")
-            ])
+            # Ship the rows as a single records array; the table renders client-side
+            records = display_df[FILE_TABLE_COLUMNS].assign(
+                Valid=np.where(display_df['Valid'].to_numpy(), "✓", "✗")
+            ).to_dict('records')
+            
+            if counts is None:
+                return f"Showing {len(filtered_df)} files", records
+            
+            breakdown = ", ".join(f"{score}%: {count}" for score, count in counts.items())
+            return (
+                f"Showing the {len(display_df) // 2} most and least complete of "
+                f"{len(filtered_df)} files (files per completeness: {breakdown})",
+                records
+            )
         
         self.app = app
         return app
@@ -463,6 +825,8 @@ class MetadataDashboard:
         
         logger.info(f"Starting dashboard server on port {port}")
         print(f"Dashboard is running at http://localhost:{port}/")
+        print(f"For production, run: {REPORT_ENV_VAR}={self.report_path} "
+              f"gunicorn -w 4 -k gevent metadata_dashboard:server")
         
         self.app.run_server(debug=debug, port=port)
 
@@ -481,15 +845,30 @@ def main():
     parser.add_argument('--report', '-r', help='Path to the metadata report file', required=True)
     parser.add_argument('--port', '-p', type=int, default=8050, help='Port to run the dashboard on')
     parser.add_argument('--debug', '-d', action='store_true', help='Run in debug mode')
+    parser.add_argument('--cache-redis-url', help='Cache computed data in Redis instead of the filesystem')
+    parser.add_argument('--no-cache', action='store_true', help='Do not cache computed data')
     args = parser.parse_args()
     
+    cache_config = None
+    if args.no_cache:
+        cache_config = {'CACHE_TYPE': 'NullCache'}
+    elif args.cache_redis_url:
+        cache_config = {'CACHE_TYPE': 'RedisCache', 'CACHE_REDIS_URL': args.cache_redis_url,
+                        'CACHE_DEFAULT_TIMEOUT': DEFAULT_CACHE_CONFIG['CACHE_DEFAULT_TIMEOUT']}
+    
     try:
-        dashboard = MetadataDashboard(args.report)
+        dashboard = MetadataDashboard(args.report, cache_config=cache_config)
         dashboard.run_server(debug=args.debug, port=args.port)
     except Exception as e:
         logger.error(f"Error running dashboard: {str(e)}")
         print(f"Error: {str(e)}")
 
 
+# WSGI entry point for gunicorn; the report is taken from the environment
+server = None
+if __name__ != "__main__" and DEPENDENCIES_AVAILABLE and os.environ.get(REPORT_ENV_VAR):
+    server = MetadataDashboard(os.environ[REPORT_ENV_VAR]).create_dashboard().server
+
+
 if __name__ == "__main__":
     main() 
\ No newline at end of file
@@ -23,8 +23,9 @@ python metadata_extractor.py --source ./src --config metadata_config.json --repo
 - re
 - argparse
 - yaml
-- colorama
-- tabulate
+- google-re2 (optional, linear-time extraction patterns)
+- orjson (optional, faster report and cache serialization)
+- colorama (optional, colored summary)
 
 @stability beta
 @performance O(n) where n is the number of files processed
@@ -34,11 +35,36 @@ import os
 import re
 import json
 import yaml
+import hashlib
 import argparse
 import logging
+import sys
+from collections import Counter, deque
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Any, Optional, Tuple
+from typing import Dict, List, Any, Optional, Tuple, Iterator
+
+# Match the extraction patterns with RE2 when it is installed; it runs in
+# linear time, and none of the patterns need backtracking-only features.
+# Configured format patterns keep using re, which supports the full syntax.
+try:
+    import re2
+    RE2_AVAILABLE = True
+except ImportError:
+    RE2_AVAILABLE = False
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# Use the libyaml-based loader for frontmatter when it is available
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
 
 try:
     from colorama import init, Fore, Style
@@ -47,6 +73,12 @@ try:
 except ImportError:
     COLORAMA_AVAILABLE = False
 
+# Color codes for the summary, empty without colorama
+_GREEN = Fore.GREEN if COLORAMA_AVAILABLE else ''
+_YELLOW = Fore.YELLOW if COLORAMA_AVAILABLE else ''
+_RED = Fore.RED if COLORAMA_AVAILABLE else ''
+_RESET = Style.RESET_ALL if COLORAMA_AVAILABLE else ''
+
 # Configure logging
 logging.basicConfig(
     level=logging.INFO,
@@ -56,6 +88,208 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 
+def _compile_extraction_re(pattern):
+    """
+    @function _compile_extraction_re
+    @description Compile an extraction pattern, with RE2 when it is available
+    
+    Bytes patterns are matched as Latin-1 by RE2, so a file that is not
+    valid UTF-8 cannot stop a match.
+    
+    @param pattern Pattern as str or bytes
+    @return Compiled pattern
+    
+    @private
+    """
+    if not RE2_AVAILABLE:
+        return re.compile(pattern)
+    if isinstance(pattern, bytes):
+        options = re2.Options()
+        options.encoding = re2.Options.Encoding.LATIN1
+        return re2.compile(pattern, options)
+    return re2.compile(pattern)
+
+
+# Extraction patterns, compiled once and shared by every file. Metadata
+# blocks are found in the raw bytes; only the matched block is decoded.
+_JSDOC_RE = _compile_extraction_re(rb'(?s)/\*\*(.*?)\*/')
+_PY_DOCSTRING_RE = _compile_extraction_re(rb'(?s)"""(.*?)"""')
+# A tag is '@name' followed by whitespace or the end of the block; it must
+# also start the block or follow whitespace, which _split_tags checks
+_TAG_HEAD_RE = _compile_extraction_re(r'@(\w+)(?:\s|$)')
+
+# One alternative of a filePattern that only matches an extension, e.g. \.jsx$
+_EXTENSION_PATTERN_RE = re.compile(r'\\\.(\w+)\$')
+
+# Metadata blocks sit at the top of a file, so only this much is read
+# unless a block starts there and ends further down
+HEAD_READ_BYTES = 8192
+
+# Opening and closing delimiters of each file type's metadata block
+_BLOCK_DELIMITERS = {
+    'javascript': (b'/**', b'*/'),
+    'python': (b'"""', b'"""'),
+    'markdown': (b'---', b'\n---')
+}
+
+# Below this many files a process pool costs more than it saves
+PARALLEL_MIN_FILES = 1000
+# Files handed to a worker process at a time
+PARALLEL_CHUNK_SIZE = 64
+
+# Without a process pool, file heads are read ahead on this many threads so
+# the waits for open() and read() overlap; at most READ_AHEAD_FILES reads
+# are in flight, which also bounds the open file descriptors
+READ_THREADS = 8
+READ_AHEAD_FILES = 64
+
+# Per-file results are cached between runs in this file inside
+# outputSettings.outputDir; bump CACHE_VERSION when extraction changes
+CACHE_FILENAME = '.metadata_cache.json'
+CACHE_VERSION = 6
+
+
+def _dumps(obj: Any, pretty: bool = False) -> bytes:
+    """
+    @function _dumps
+    @description Serialize an object to JSON bytes, with orjson when available
+    
+    Values JSON has no type for, such as dates parsed from YAML
+    frontmatter, are written as strings by both serializers.
+    
+    @param obj Object to serialize
+    @param pretty Whether to indent the output by two spaces
+    @return UTF-8 encoded JSON
+    
+    @private
+    """
+    if ORJSON_AVAILABLE:
+        option = orjson.OPT_NON_STR_KEYS | (orjson.OPT_INDENT_2 if pretty else 0)
+        return orjson.dumps(obj, default=str, option=option)
+    return json.dumps(obj, indent=2 if pretty else None, default=str).encode('utf-8')
+
+
+def _write_json_object(f, items: Iterator[Tuple[str, Any]], pretty: bool = False, depth: int = 0) -> None:
+    """
+    @function _write_json_object
+    @description Write a JSON object entry by entry, as _dumps would format it
+    
+    Only one entry is serialized at a time, so the encoded object is never
+    held in memory as a whole.
+    
+    @param f Binary file to write to
+    @param items Iterator of (key, value) pairs
+    @param pretty Whether to indent the output by two spaces
+    @param depth Nesting depth of the object within the document
+    
+    @private
+    """
+    if pretty:
+        newline = b'\n' + b'  ' * (depth + 1)
+        opening, separator, colon = b'{' + newline, b',' + newline, b': '
+        closing = b'\n' + b'  ' * depth + b'}'
+    elif ORJSON_AVAILABLE:
+        opening, separator, colon, closing = b'{', b',', b':', b'}'
+    else:
+        opening, separator, colon, closing = b'{', b', ', b': ', b'}'
+    
+    write = f.write
+    first = True
+    for key, value in items:
+        write(opening if first else separator)
+        first = False
+        write(_dumps(key))
+        write(colon)
+        value = _dumps(value, pretty)
+        write(value.replace(b'\n', newline) if pretty else value)
+    write(b'{}' if first else closing)
+
+
+def _decode_block(block: bytes) -> str:
+    """
+    @function _decode_block
+    @description Decode a metadata block read from a file in binary mode
+    
+    Newlines are normalized the same way text-mode reads do.
+    
+    @param block Raw bytes of the block
+    @return Decoded block
+    
+    @private
+    """
+    text = block.decode('utf-8', 'replace')
+    if '\r' in text:
+        text = text.replace('\r\n', '\n').replace('\r', '\n')
+    return text
+
+
+def _pattern_extensions(pattern: str) -> Optional[List[str]]:
+    """
+    @function _pattern_extensions
+    @description Get the extensions a file pattern matches, if that is all it matches
+    
+    @param pattern A filePattern such as r"\.js$|\.jsx$"
+    @return Extensions without the dot, or None when the pattern is not
+            a plain alternation of extensions
+    
+    @private
+    """
+    extensions = []
+    for alternative in pattern.split('|'):
+        match = _EXTENSION_PATTERN_RE.fullmatch(alternative)
+        if match is None:
+            return None
+        extensions.append(match.group(1))
+    return extensions
+
+
+def _file_extension(file_name: str) -> str:
+    """
+    @function _file_extension
+    @description Get the extension of a file name, without the dot
+    
+    @param file_name Name of the file
+    @return Text after the last dot, or an empty string if there is none
+    
+    @private
+    """
+    _, dot, ext = file_name.rpartition('.')
+    return ext if dot else ''
+
+
+def _split_tags(block: str) -> Iterator[Tuple[str, str]]:
+    """
+    @function _split_tags
+    @description Split a comment block into its tags in a single linear pass
+    
+    Each tag's value is the text up to the start of the next tag, so the
+    block is scanned once instead of looking ahead for the next tag after
+    every value. A tag name must be followed by whitespace or the end of
+    the block, so '@' inside a longer word is not a tag.
+    
+    The value keeps the separator after the tag name, so a newline there
+    is still cleaned up with the ' *' continuation that follows it.
+    
+    @param block Content of the comment block
+    @return Iterator of (tag name, raw tag value) tuples
+    
+    @example
+    ```python
+    list(_split_tags(' @version 1.2.3 @since 1.0.0'))
+    # [('version', ' 1.2.3 '), ('since', ' 1.0.0')]
+    list(_split_tags(' @vitest-environment node, mail@user.name'))
+    # []
+    ```
+    
+    @private
+    """
+    heads = [head for head in _TAG_HEAD_RE.finditer(block)
+             if head.start() == 0 or block[head.start() - 1].isspace()]
+    for i, head in enumerate(heads):
+        end = heads[i + 1].start() if i + 1 < len(heads) else len(block)
+        yield head.group(1), block[head.end(1):end]
+
+
 class MetadataExtractor:
     """
     @class MetadataExtractor
@@ -70,23 +304,31 @@ class MetadataExtractor:
     @author MetadataTeam
     """
     
-    def __init__(self, config_path: Optional[str] = None):
+    def __init__(self, config_path: Optional[str] = None, config: Optional[Dict[str, Any]] = None,
+                 use_cache: bool = True):
         """
         @method __init__
         @description Initialize the metadata extractor with configuration
         
         @param config_path Path to the configuration file (JSON)
+        @param config Configuration dictionary, used instead of config_path
+        @param use_cache Whether to reuse results for files unchanged since the last run
         """
-        self.config = self._load_config(config_path) if config_path else self._default_config()
+        self.use_cache = use_cache
+        if config is not None:
+            self.config = config
+        else:
+            self.config = self._load_config(config_path) if config_path else self._default_config()
+        self._compile_rules()
         self.results = {
             'processed_files': 0,
             'files_with_metadata': 0,
             'files_with_complete_metadata': 0,
-            'missing_fields': {},
-            'invalid_formats': {},
+            'missing_fields': Counter(),
+            'invalid_formats': Counter(),
             'file_results': {},
-            'by_language': {},
-            'by_file_extension': {}
+            'by_language': Counter(),
+            'by_file_extension': Counter()
         }
         
         logger.info(f"Initialized MetadataExtractor{' with config from ' + config_path if config_path else ''}")
@@ -110,6 +352,57 @@ class MetadataExtractor:
             logger.error(f"Failed to load config: {str(e)}")
             return self._default_config()
     
+    def _compile_rules(self) -> None:
+        """
+        @method _compile_rules
+        @description Compile the configured patterns and required fields once
+        
+        @private
+        """
+        self._lang_res = {
+            language: re.compile(rules['filePattern'])
+            for language, rules in self.config['extractionRules'].items()
+        }
+        
+        # Patterns that only list extensions are resolved with a dictionary
+        # lookup. From the first pattern that is not, every pattern is
+        # matched as a regex so the first matching language still wins.
+        self._ext_to_lang: Dict[str, str] = {}
+        self._fallback_res = {}
+        for language, pattern in self._lang_res.items():
+            extensions = None if self._fallback_res else _pattern_extensions(pattern.pattern)
+            if extensions is None:
+                self._fallback_res[language] = pattern
+            else:
+                for ext in extensions:
+                    self._ext_to_lang.setdefault(ext, language)
+        # Results of the regex fallback, keyed by the name that was matched
+        self._fallback_cache: Dict[str, Optional[str]] = {}
+        
+        # Like extractionRules, formatValidation and requiredFields must be
+        # present: a config without them fails here rather than validating
+        # every file against no rules
+        self._format_res = {}
+        for field, pattern in self.config['formatValidation'].items():
+            try:
+                self._format_res[field] = re.compile(pattern)
+            except re.error as e:
+                logger.error(f"Invalid format pattern for '{field}', skipping: {str(e)}")
+        
+        # Required fields per file type: the common fields, then the
+        # type's own, each listed once
+        required = self.config['requiredFields']
+        self._required_all = tuple(dict.fromkeys(required.get('all', [])))
+        self._required_by_lang = {
+            language: tuple(dict.fromkeys(self._required_all + tuple(fields)))
+            for language, fields in required.items()
+            if language != 'all'
+        }
+        self._required_all_set = frozenset(self._required_all)
+        self._required_sets = {
+            language: frozenset(fields) for language, fields in self._required_by_lang.items()
+        }
+    
     def _default_config(self) -> Dict[str, Any]:
         """
         @method _default_config
@@ -130,7 +423,7 @@ class MetadataExtractor:
             },
             "formatValidation": {
                 "version": r"^\d+\.\d+\.\d+$",
-                "email": r"^[\w-\.]+@([\w-]+\.)+[\w-]{2,4}$",
+                "email": r"^[\w.-]+@([\w-]+\.)+[\w-]{2,4}$",
                 "date": r"^\d{4}-\d{2}-\d{2}$"
             },
             "extractionRules": {
@@ -159,13 +452,14 @@ class MetadataExtractor:
             }
         }
     
-    def process_directory(self, directory_path: str, recursive: bool = True) -> Dict[str, Any]:
+    def process_directory(self, directory_path: str, recursive: bool = True, workers: int = 1) -> Dict[str, Any]:
         """
         @method process_directory
         @description Process all files in a directory
         
         @param directory_path Path to the directory to process
         @param recursive Whether to process subdirectories
+        @param workers Number of worker processes used to extract metadata
         @return Dictionary containing the extraction results
         """
         logger.info(f"Processing directory: {directory_path}")
@@ -175,133 +469,347 @@ class MetadataExtractor:
             'processed_files': 0,
             'files_with_metadata': 0,
             'files_with_complete_metadata': 0,
-            'missing_fields': {},
-            'invalid_formats': {},
+            'missing_fields': Counter(),
+            'invalid_formats': Counter(),
             'file_results': {},
-            'by_language': {},
-            'by_file_extension': {}
+            'by_language': Counter(),
+            'by_file_extension': Counter()
         }
         
-        # Process files
-        for path in self._find_files(directory_path, recursive):
-            self._process_file(path)
+        # Process files as the walk classifies them; results are merged here
+        files = self._iter_files(directory_path, recursive)
+        
+        # Reuse the results of files unchanged since the last run
+        if self.use_cache:
+            cache = self._load_cache()
+            # Entries outside this directory are kept for other runs
+            root = os.path.join(os.path.abspath(directory_path), '')
+            new_cache = {path: entry for path, entry in cache.items() if not path.startswith(root)}
+            files = self._use_cached_results(files, cache, new_cache)
+        
+        for result in self._analyze_files(files, workers):
+            self._record_file_result(*result)
+            if self.use_cache:
+                entry = new_cache.get(os.path.abspath(result[0]))
+                if entry is not None:
+                    entry.extend(result[3:])
+        
+        if self.use_cache:
+            self._save_cache(new_cache)
+        
+        logger.info(f"Processed {self.results['processed_files']} files")
         
         # Calculate statistics
         self._calculate_statistics()
         
         return self.results
     
-    def _find_files(self, directory_path: str, recursive: bool = True) -> List[str]:
+    def _cache_path(self) -> str:
         """
-        @method _find_files
-        @description Find files to process in a directory
+        @method _cache_path
+        @description Get the path of the per-file result cache
         
-        @param directory_path Path to the directory to process
-        @param recursive Whether to process subdirectories
-        @return List of file paths to process
+        @return Path to the cache file
+        
+        @private
+        """
+        return os.path.join(self.config['outputSettings']['outputDir'], CACHE_FILENAME)
+    
+    def _cache_key(self) -> str:
+        """
+        @method _cache_key
+        @description Fingerprint the configuration the cached results depend on
+        
+        @return Hex digest identifying the cache format and configuration
+        
+        @private
+        """
+        config = json.dumps([CACHE_VERSION, self.config], sort_keys=True, default=str)
+        return hashlib.blake2b(config.encode('utf-8'), digest_size=16).hexdigest()
+    
+    def _load_cache(self) -> Dict[str, List[Any]]:
+        """
+        @method _load_cache
+        @description Load the per-file result cache
+        
+        @return Dictionary mapping absolute file paths to
+                [mtime_ns, size, metadata, validation] entries; empty when
+                there is no cache or it was written for another configuration
         
         @private
         """
-        files = []
+        try:
+            with open(self._cache_path(), 'rb') as f:
+                buf = f.read()
+            cache = orjson.loads(buf) if ORJSON_AVAILABLE else json.loads(buf)
+        except (OSError, ValueError):
+            return {}
+        
+        if not isinstance(cache, dict) or cache.get('key') != self._cache_key():
+            return {}
+        return cache.get('files', {})
+    
+    def _save_cache(self, entries: Dict[str, List[Any]]) -> None:
+        """
+        @method _save_cache
+        @description Atomically replace the per-file result cache
+        
+        @param entries Cache entries for the files seen in this run
         
-        # Create patterns for file types
-        patterns = []
-        for language, rules in self.config['extractionRules'].items():
-            patterns.append(rules['filePattern'])
+        @private
+        """
+        cache_path = self._cache_path()
+        tmp_path = f"{cache_path}.tmp"
+        try:
+            os.makedirs(os.path.dirname(cache_path) or '.', exist_ok=True)
+            with open(tmp_path, 'wb') as f:
+                f.write(_dumps({'key': self._cache_key(), 'files': entries}))
+            os.replace(tmp_path, cache_path)
+        except OSError as e:
+            logger.warning(f"Could not write cache {cache_path}: {str(e)}")
+    
+    def _use_cached_results(self, files: Iterator[Tuple[str, str, str]], cache: Dict[str, List[Any]],
+                            new_cache: Dict[str, List[Any]]) -> Iterator[Tuple[str, str, str]]:
+        """
+        @method _use_cached_results
+        @description Record cached results and pass on the files that changed
+        
+        A file is unchanged when its modification time and size match the
+        cache entry. Unchanged files are recorded from the cache without
+        being read; every file gets an entry in new_cache, which changed
+        files complete once they have been analyzed.
         
-        # Compile the regex patterns
-        pattern_regexes = [re.compile(pattern) for pattern in patterns]
+        @param files Iterator of (file path, file type, extension) tuples
+        @param cache Entries loaded from the previous run
+        @param new_cache Entries for this run, filled in as files are seen
+        @return Iterator of (file path, file type, extension) tuples that need analysis
         
-        # Walk through directory
-        for root, dirs, filenames in os.walk(directory_path):
-            for filename in filenames:
-                file_path = os.path.join(root, filename)
-                
-                # Check if file matches any pattern
-                if any(pattern.search(filename) for pattern in pattern_regexes):
-                    files.append(file_path)
+        @private
+        """
+        for file in files:
+            file_path = file[0]
+            key = os.path.abspath(file_path)
+            try:
+                st = os.stat(file_path)
+            except OSError:
+                yield file
+                continue
             
-            if not recursive:
-                break
+            entry = cache.get(key)
+            if entry is not None and entry[0] == st.st_mtime_ns and entry[1] == st.st_size:
+                new_cache[key] = entry
+                self._record_file_result(*file, entry[2], entry[3])
+            else:
+                new_cache[key] = [st.st_mtime_ns, st.st_size]
+                yield file
+    
+    def _analyze_files(self, files: Iterator[Tuple[str, str, str]], workers: int) -> Iterator[Tuple[Any, ...]]:
+        """
+        @method _analyze_files
+        @description Analyze files, spreading the work over worker processes
         
-        logger.info(f"Found {len(files)} files to process")
-        return files
+        @param files Iterator of (file path, file type, extension) tuples
+        @param workers Number of worker processes to use
+        @return Iterator of (file path, file type, extension, metadata,
+                validation result) tuples, in the order of files
+        
+        @private
+        """
+        if workers > 1:
+            files = list(files)
+            if len(files) >= PARALLEL_MIN_FILES:
+                paths, file_types, _ = zip(*files)
+                with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                                         initargs=(self.config,)) as executor:
+                    results = executor.map(_process_file_worker, paths, file_types,
+                                           chunksize=PARALLEL_CHUNK_SIZE)
+                    for file, result in zip(files, results):
+                        yield file + result
+                return
+        
+        # Read heads on a thread pool while metadata is extracted here
+        with ThreadPoolExecutor(max_workers=READ_THREADS) as executor:
+            pending = deque()
+            for file in files:
+                pending.append((file, executor.submit(self._load_head, file[0], file[1])))
+                if len(pending) >= READ_AHEAD_FILES:
+                    file, future = pending.popleft()
+                    yield file + self._analyze_file(file[0], file[1], future.result())
+            while pending:
+                file, future = pending.popleft()
+                yield file + self._analyze_file(file[0], file[1], future.result())
     
-    def _process_file(self, file_path: str) -> Dict[str, Any]:
+    def _iter_files(self, directory_path: str, recursive: bool = True) -> Iterator[Tuple[str, str, str]]:
+        """
+        @method _iter_files
+        @description Walk a directory and yield the files to process
+        
+        Each file is classified by name while its directory is scanned, so
+        the file patterns are matched once per file and no list of all
+        paths is built. The scandir entry's path and the extension found
+        while classifying are passed on rather than derived again later.
+        
+        @param directory_path Path to the directory to process
+        @param recursive Whether to process subdirectories
+        @return Iterator of (file path, file type, extension) tuples
+        
+        @private
+        """
+        stack = [directory_path]
+        while stack:
+            current = stack.pop()
+            try:
+                with os.scandir(current) as entries:
+                    for entry in entries:
+                        if entry.is_dir():
+                            # Like os.walk, do not descend into symlinked directories
+                            if recursive and not entry.is_symlink():
+                                stack.append(entry.path)
+                            continue
+                        
+                        _, dot, ext = entry.name.rpartition('.')
+                        if not dot:
+                            ext = ''
+                        file_type = self._determine_file_type(entry.name, ext)
+                        if file_type:
+                            yield entry.path, file_type, ext
+            except OSError as e:
+                logger.warning(f"Could not scan {current}: {str(e)}")
+    
+    def _process_file(self, file_path: str, file_type: Optional[str] = None) -> Dict[str, Any]:
         """
         @method _process_file
         @description Process a single file
         
         @param file_path Path to the file to process
+        @param file_type Type of the file, determined from the path if not given
         @return Dictionary containing the extraction results for the file
         
+        @private
+        """
+        # Determine file type
+        ext = _file_extension(os.path.basename(file_path))
+        if file_type is None:
+            file_type = self._determine_file_type(file_path, ext)
+        if not file_type:
+            logger.warning(f"Unknown file type for {file_path}, skipping")
+            return {}
+        
+        return self._record_file_result(file_path, file_type, ext, *self._analyze_file(file_path, file_type))
+    
+    def _analyze_file(self, file_path: str, file_type: str,
+                      content: Optional[bytes] = None) -> Tuple[Dict[str, Any], Optional[Dict[str, Any]]]:
+        """
+        @method _analyze_file
+        @description Extract and validate the metadata of a single file
+        
+        This does not touch self.results, so it can run in a worker process.
+        
+        @param file_path Path to the file to process
+        @param file_type Type of the file
+        @param content Head of the file if it was already read
+        @return Tuple of metadata and validation result; the validation
+                result is None when no metadata was found
+        
         @private
         """
         try:
             logger.debug(f"Processing file: {file_path}")
             
-            # Determine file type
-            file_type = self._determine_file_type(file_path)
-            if not file_type:
-                logger.warning(f"Unknown file type for {file_path}, skipping")
-                return {}
-            
-            # Increment processed files count
-            self.results['processed_files'] += 1
-            
             # Extract metadata
-            metadata = self._extract_metadata(file_path, file_type)
+            if content is None:
+                content = self._load_head(file_path, file_type)
+            metadata = self._extract_metadata_from_bytes(content, file_type)
             
             # Check if any metadata was found
-            if metadata:
-                self.results['files_with_metadata'] += 1
-                
-                # Validate metadata
-                validation_result = self._validate_metadata(metadata, file_type)
-                
-                # Store results
-                file_result = {
-                    'file_path': file_path,
-                    'file_type': file_type,
-                    'metadata': metadata,
-                    'validation': validation_result
-                }
-                
-                self.results['file_results'][file_path] = file_result
-                
-                # Update language and extension statistics
-                ext = os.path.splitext(file_path)[1].lstrip('.')
-                self.results['by_file_extension'][ext] = self.results['by_file_extension'].get(ext, 0) + 1
-                self.results['by_language'][file_type] = self.results['by_language'].get(file_type, 0) + 1
-                
-                # Check if all required fields are present
-                if validation_result['valid']:
-                    self.results['files_with_complete_metadata'] += 1
-                
-                return file_result
-            else:
+            if not metadata:
                 logger.warning(f"No metadata found in {file_path}")
-                return {}
-                
+                return {}, None
+            
+            # Validate metadata
+            return metadata, self._validate_metadata(metadata, file_type)
+        
         except Exception as e:
             logger.error(f"Error processing {file_path}: {str(e)}")
+            return {}, None
+    
+    def _record_file_result(self, file_path: str, file_type: str, ext: str, metadata: Dict[str, Any],
+                            validation_result: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+        """
+        @method _record_file_result
+        @description Add the result of a single file to the overall results
+        
+        @param file_path Path to the processed file
+        @param file_type Type of the file
+        @param ext Extension of the file, without the dot
+        @param metadata Dictionary containing the extracted metadata
+        @param validation_result Validation result, None if no metadata was found
+        @return Dictionary containing the extraction results for the file
+        
+        @private
+        """
+        # Increment processed files count
+        self.results['processed_files'] += 1
+        
+        if validation_result is None:
             return {}
+        
+        self.results['files_with_metadata'] += 1
+        
+        # Store results in the shape the report uses; the path is the key
+        file_result = {
+            'file_type': file_type,
+            'metadata': metadata,
+            'validation': validation_result
+        }
+        
+        self.results['file_results'][file_path] = file_result
+        
+        # Update language and extension statistics
+        self.results['by_file_extension'][ext] += 1
+        self.results['by_language'][file_type] += 1
+        
+        # Update global validation statistics
+        self.results['missing_fields'].update(validation_result['missing_fields'])
+        self.results['invalid_formats'].update(
+            invalid['field'] for invalid in validation_result['invalid_formats']
+        )
+        
+        # Check if all required fields are present
+        if validation_result['valid']:
+            self.results['files_with_complete_metadata'] += 1
+        
+        return file_result
     
-    def _determine_file_type(self, file_path: str) -> Optional[str]:
+    def _determine_file_type(self, file_path: str, ext: Optional[str] = None) -> Optional[str]:
         """
         @method _determine_file_type
         @description Determine the type of a file
         
         @param file_path Path to the file
+        @param ext Extension of the file without the dot, taken from the path if not given
         @return String identifying the file type or None if unknown
         
         @private
         """
-        for language, rules in self.config['extractionRules'].items():
-            pattern = rules['filePattern']
-            if re.search(pattern, file_path):
-                return language
-        return None
+        if ext is None:
+            ext = _file_extension(os.path.basename(file_path))
+        language = self._ext_to_lang.get(ext)
+        if language is not None or not self._fallback_res:
+            return language
+        
+        try:
+            return self._fallback_cache[file_path]
+        except KeyError:
+            pass
+        
+        language = None
+        for candidate, pattern in self._fallback_res.items():
+            if pattern.search(file_path):
+                language = candidate
+                break
+        self._fallback_cache[file_path] = language
+        return language
     
     def _extract_metadata(self, file_path: str, file_type: str) -> Dict[str, Any]:
         """
@@ -314,14 +822,19 @@ class MetadataExtractor:
         
         @private
         """
-        # Read file content
-        try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                content = f.read()
-        except Exception as e:
-            logger.error(f"Error reading {file_path}: {str(e)}")
-            return {}
+        return self._extract_metadata_from_bytes(self._load_head(file_path, file_type), file_type)
+    
+    def _extract_metadata_from_bytes(self, content: bytes, file_type: str) -> Dict[str, Any]:
+        """
+        @method _extract_metadata_from_bytes
+        @description Extract metadata from the head of a file
         
+        @param content Raw bytes from the start of the file
+        @param file_type Type of the file
+        @return Dictionary containing the extracted metadata
+        
+        @private
+        """
         # Extract metadata based on file type
         if file_type == 'javascript':
             return self._extract_jsdoc_metadata(content)
@@ -332,12 +845,53 @@ class MetadataExtractor:
         else:
             return {}
     
-    def _extract_jsdoc_metadata(self, content: str) -> Dict[str, Any]:
+    def _load_head(self, file_path: str, file_type: str) -> bytes:
+        """
+        @method _load_head
+        @description Read the head of a file, logging read errors
+        
+        @param file_path Path to the file
+        @param file_type Type of the file
+        @return Raw bytes from the start of the file, empty if it could not be read
+        
+        @private
+        """
+        try:
+            return self._read_head(file_path, file_type)
+        except Exception as e:
+            logger.error(f"Error reading {file_path}: {str(e)}")
+            return b''
+    
+    def _read_head(self, file_path: str, file_type: str) -> bytes:
+        """
+        @method _read_head
+        @description Read the part of a file that holds its metadata block
+        
+        The first HEAD_READ_BYTES are read; the rest of the file is only read
+        when the metadata block starts within them but is not closed there.
+        
+        @param file_path Path to the file
+        @param file_type Type of the file
+        @return Raw bytes from the start of the file
+        
+        @private
+        """
+        with open(file_path, 'rb') as f:
+            content = f.read(HEAD_READ_BYTES)
+            delimiters = _BLOCK_DELIMITERS.get(file_type)
+            if delimiters and len(content) == HEAD_READ_BYTES:
+                opening, closing = delimiters
+                start = content.find(opening)
+                if start >= 0 and content.find(closing, start + len(opening)) < 0:
+                    content += f.read()
+        return content
+    
+    def _extract_jsdoc_metadata(self, content: bytes) -> Dict[str, Any]:
         """
         @method _extract_jsdoc_metadata
         @description Extract metadata from JSDoc comments
         
-        @param content Content of the file
+        @param content Head of the file
         @return Dictionary containing the extracted metadata
         
         @private
@@ -345,29 +899,25 @@ class MetadataExtractor:
         metadata = {}
         
         # Find the JSDoc block at the top of the file
-        jsdoc_pattern = r'/\*\*(.*?)\*/'
-        match = re.search(jsdoc_pattern, content, re.DOTALL)
+        match = _JSDOC_RE.search(content)
         
-        if match:
-            jsdoc_content = match.group(1)
+        # A block without '@' has no tags, so skip decoding and splitting it
+        if match and content.find(b'@', match.start(1), match.end(1)) >= 0:
+            jsdoc_content = _decode_block(match.group(1))
             
             # Extract tags
-            tag_pattern = r'@(\w+)\s+(.*?)(?=\s+@\w+|\s*$)'
-            tags = re.findall(tag_pattern, jsdoc_content, re.DOTALL)
-            
-            for tag_name, tag_value in tags:
+            for tag_name, tag_value in _split_tags(jsdoc_content):
                 # Clean up multi-line values
-                tag_value = tag_value.strip().replace('\n *', '\n')
-                metadata[tag_name] = tag_value
+                metadata[tag_name] = tag_value.replace('\n *', '\n').strip()
         
         return metadata
     
-    def _extract_python_metadata(self, content: str) -> Dict[str, Any]:
+    def _extract_python_metadata(self, content: bytes) -> Dict[str, Any]:
         """
         @method _extract_python_metadata
         @description Extract metadata from Python docstrings
         
-        @param content Content of the file
+        @param content Head of the file
         @return Dictionary containing the extracted metadata
         
         @private
@@ -375,43 +925,39 @@ class MetadataExtractor:
         metadata = {}
         
         # Find the docstring at the top of the file
-        docstring_pattern = r'"""(.*?)"""'
-        match = re.search(docstring_pattern, content, re.DOTALL)
+        match = _PY_DOCSTRING_RE.search(content)
         
-        if match:
-            docstring_content = match.group(1)
+        # A docstring without '@' has no tags, so skip decoding and splitting it
+        if match and content.find(b'@', match.start(1), match.end(1)) >= 0:
+            docstring_content = _decode_block(match.group(1))
             
             # Extract tags
-            tag_pattern = r'@(\w+)(?:\s+(.+?)(?=\s+@\w+|\s*$)|\s*$)'
-            tags = re.findall(tag_pattern, docstring_content, re.DOTALL)
-            
-            for tag_name, tag_value in tags:
+            for tag_name, tag_value in _split_tags(docstring_content):
                 # Clean up multi-line values
-                tag_value = tag_value.strip()
-                metadata[tag_name] = tag_value
+                metadata[tag_name] = tag_value.strip()
         
         return metadata
     
-    def _extract_markdown_metadata(self, content: str) -> Dict[str, Any]:
+    def _extract_markdown_metadata(self, content: bytes) -> Dict[str, Any]:
         """
         @method _extract_markdown_metadata
         @description Extract metadata from Markdown frontmatter
         
-        @param content Content of the file
+        @param content Head of the file
         @return Dictionary containing the extracted metadata
         
         @private
         """
-        # Find the frontmatter block
-        frontmatter_pattern = r'^---\s+(.*?)\s+---'
-        match = re.search(frontmatter_pattern, content, re.DOTALL)
-        
-        if match:
-            frontmatter_content = match.group(1)
+        # Frontmatter has to open the file, so plain string searches find it
+        if content.startswith(b'---') and content[3:4].isspace():
+            end = content.find(b'\n---', 3)
+            if end < 0:
+                return {}
+            frontmatter_content = _decode_block(content[3:end].strip())
             
             try:
                 # Parse YAML frontmatter
-                metadata = yaml.safe_load(frontmatter_content)
+                metadata = yaml.load(frontmatter_content, Loader=_YamlLoader)
                 return metadata if metadata else {}
             except Exception as e:
                 logger.error(f"Error parsing frontmatter: {str(e)}")
@@ -435,32 +981,26 @@ class MetadataExtractor:
             'invalid_formats': []
         }
         
-        # Check required fields
-        required_fields = self.config['requiredFields'].get('all', []).copy()
-        if file_type in self.config['requiredFields']:
-            required_fields.extend(self.config['requiredFields'][file_type])
-        
-        for field in required_fields:
-            if field not in metadata or not metadata[field]:
-                result['missing_fields'].append(field)
-                result['valid'] = False
-                
-                # Update global statistics
-                self.results['missing_fields'][field] = self.results['missing_fields'].get(field, 0) + 1
+        # Check required fields: a field is missing unless it has a value
+        present = {field for field, value in metadata.items() if value}
+        missing = self._required_sets.get(file_type, self._required_all_set) - present
+        if missing:
+            # Report them in the configured order
+            required_fields = self._required_by_lang.get(file_type, self._required_all)
+            result['missing_fields'] = [field for field in required_fields if field in missing]
+            result['valid'] = False
         
-        # Check format validation
-        for field, pattern in self.config['formatValidation'].items():
-            if field in metadata and metadata[field]:
-                if not re.match(pattern, str(metadata[field])):
+        # Check format validation; the whole value has to match
+        for field, pattern in self._format_res.items():
+            value = metadata.get(field)
+            if value:
+                if not pattern.fullmatch(value if type(value) is str else str(value)):
                     result['invalid_formats'].append({
                         'field': field,
-                        'value': metadata[field],
-                        'pattern': pattern
+                        'value': value,
+                        'pattern': pattern.pattern
                     })
                     result['valid'] = False
-                    
-                    # Update global statistics
-                    self.results['invalid_formats'][field] = self.results['invalid_formats'].get(field, 0) + 1
         
         return result
     
@@ -480,17 +1020,8 @@ class MetadataExtractor:
             self.results['complete_metadata_coverage'] = 0
         
         # Calculate most common issues
-        self.results['most_common_missing_fields'] = sorted(
-            self.results['missing_fields'].items(), 
-            key=lambda x: x[1], 
-            reverse=True
-        )[:5]
-        
-        self.results['most_common_invalid_formats'] = sorted(
-            self.results['invalid_formats'].items(), 
-            key=lambda x: x[1], 
-            reverse=True
-        )[:5]
+        self.results['most_common_missing_fields'] = self.results['missing_fields'].most_common(5)
+        self.results['most_common_invalid_formats'] = self.results['invalid_formats'].most_common(5)
     
     def generate_report(self, output_path: Optional[str] = None) -> str:
         """
@@ -519,13 +1050,7 @@ class MetadataExtractor:
             'by_file_extension': self.results['by_file_extension'],
             'most_common_missing_fields': dict(self.results['most_common_missing_fields']),
             'most_common_invalid_formats': dict(self.results['most_common_invalid_formats']),
-            'file_results': {
-                path: {
-                    'metadata': data['metadata'],
-                    'validation': data['validation']
-                }
-                for path, data in self.results['file_results'].items()
-            }
+            'file_results': {}
         }
         
         # Determine output path
@@ -535,9 +1060,15 @@ class MetadataExtractor:
             timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
             output_path = os.path.join(output_dir, f"metadata_report_{timestamp}.json")
         
-        # Save report
-        with open(output_path, 'w', encoding='utf-8') as f:
-            json.dump(report, f, indent=2 if self.config['outputSettings']['prettify'] else None)
+        # Save report; file_results is written one file at a time in
+        # place of the empty object that ends the serialized summary
+        pretty = self.config['outputSettings']['prettify']
+        footer = b'\n}' if pretty else b'}'
+        header = _dumps(report, pretty=pretty)[:-len(b'{}' + footer)]
+        with open(output_path, 'wb') as f:
+            f.write(header)
+            _write_json_object(f, self.results['file_results'].items(), pretty=pretty, depth=1)
+            f.write(footer)
         
         logger.info(f"Report generated at {output_path}")
         return output_path
@@ -546,49 +1077,72 @@ class MetadataExtractor:
         """
         @method print_summary
         @description Print a summary of the metadata extraction results
+        
+        The summary is built as a list of lines and written in one call.
         """
         if self.results['processed_files'] == 0:
             print("No files were processed.")
             return
         
-        # Define colors if colorama is available
-        GREEN = Fore.GREEN if COLORAMA_AVAILABLE else ''
-        YELLOW = Fore.YELLOW if COLORAMA_AVAILABLE else ''
-        RED = Fore.RED if COLORAMA_AVAILABLE else ''
-        RESET = Style.RESET_ALL if COLORAMA_AVAILABLE else ''
-        
-        # Print summary
-        print("\n" + "="*50)
-        print(f"METADATA EXTRACTION SUMMARY")
-        print("="*50)
+        rule = "=" * 50
+        lines = ["", rule, "METADATA EXTRACTION SUMMARY", rule]
         
         # Calculate color for coverage
         metadata_coverage = self.results['metadata_coverage']
         complete_coverage = self.results['complete_metadata_coverage']
         
-        metadata_color = GREEN if metadata_coverage >= 80 else (YELLOW if metadata_coverage >= 50 else RED)
-        complete_color = GREEN if complete_coverage >= 80 else (YELLOW if complete_coverage >= 50 else RED)
+        metadata_color = _GREEN if metadata_coverage >= 80 else (_YELLOW if metadata_coverage >= 50 else _RED)
+        complete_color = _GREEN if complete_coverage >= 80 else (_YELLOW if complete_coverage >= 50 else _RED)
         
-        print(f"\nProcessed {self.results['processed_files']} files:")
-        print(f"- Files with metadata: {metadata_color}{self.results['files_with_metadata']} ({metadata_coverage:.1f}%){RESET}")
-        print(f"- Files with complete metadata: {complete_color}{self.results['files_with_complete_metadata']} ({complete_coverage:.1f}%){RESET}")
+        lines.append(f"\nProcessed {self.results['processed_files']} files:")
+        lines.append(f"- Files with metadata: {metadata_color}{self.results['files_with_metadata']} ({metadata_coverage:.1f}%){_RESET}")
+        lines.append(f"- Files with complete metadata: {complete_color}{self.results['files_with_complete_metadata']} ({complete_coverage:.1f}%){_RESET}")
         
         if self.results['most_common_missing_fields']:
-            print("\nMost common missing fields:")
-            for field, count in self.results['most_common_missing_fields']:
-                print(f"- {field}: {count} files")
+            lines.append("\nMost common missing fields:")
+            lines.extend(f"- {field}: {count} files" for field, count in self.results['most_common_missing_fields'])
         
         if self.results['most_common_invalid_formats']:
-            print("\nMost common invalid formats:")
-            for field, count in self.results['most_common_invalid_formats']:
-                print(f"- {field}: {count} files")
+            lines.append("\nMost common invalid formats:")
+            lines.extend(f"- {field}: {count} files" for field, count in self.results['most_common_invalid_formats'])
         
         if self.results['by_language']:
-            print("\nFiles by language:")
-            for language, count in self.results['by_language'].items():
-                print(f"- {language}: {count} files")
+            lines.append("\nFiles by language:")
+            lines.extend(f"- {language}: {count} files" for language, count in self.results['by_language'].items())
         
-        print("\n" + "="*50)
+        lines.append("\n" + rule)
+        sys.stdout.write("\n".join(lines) + "\n")
+
+
+# Extractor used by a pool worker process, created once per process
+_worker_extractor: Optional[MetadataExtractor] = None
+
+
+def _init_worker(config: Dict[str, Any]) -> None:
+    """
+    @function _init_worker
+    @description Create the extractor used by a pool worker process
+    
+    @param config Configuration of the parent extractor
+    
+    @private
+    """
+    global _worker_extractor
+    _worker_extractor = MetadataExtractor(config=config, use_cache=False)
+
+
+def _process_file_worker(file_path: str, file_type: str) -> Tuple[Dict[str, Any], Optional[Dict[str, Any]]]:
+    """
+    @function _process_file_worker
+    @description Analyze a single file in a pool worker process
+    
+    @param file_path Path to the file to process
+    @param file_type Type of the file
+    @return Result of MetadataExtractor._analyze_file
+    
+    @private
+    """
+    return _worker_extractor._analyze_file(file_path, file_type)
 
 
 def main():
@@ -603,6 +1157,9 @@ def main():
     parser.add_argument('--recursive', '-r', action='store_true', help='Process subdirectories recursively')
     parser.add_argument('--report', action='store_true', help='Generate a JSON report')
     parser.add_argument('--verbose', '-v', action='store_true', help='Enable verbose output')
+    parser.add_argument('--no-cache', action='store_true', help='Re-read every file instead of reusing cached results')
+    parser.add_argument('--workers', '-j', type=int, default=os.cpu_count() or 1,
+                        help='Number of worker processes (default: number of CPUs)')
     args = parser.parse_args()
     
     # Set logging level
@@ -610,10 +1167,10 @@ def main():
         logging.getLogger().setLevel(logging.DEBUG)
     
     # Create extractor
-    extractor = MetadataExtractor(args.config)
+    extractor = MetadataExtractor(args.config, use_cache=not args.no_cache)
     
     # Process directory
-    extractor.process_directory(args.source, args.recursive)
+    extractor.process_directory(args.source, args.recursive, workers=args.workers)
     
     # Print summary
     extractor.print_summary()
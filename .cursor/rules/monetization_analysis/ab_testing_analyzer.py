@@ -18,19 +18,158 @@ import argparse
 import json
 import os
 import re
+import sys
+import tempfile
+from array import array
+from bisect import bisect_left, bisect_right
+from itertools import islice
 from pathlib import Path
 import yaml
 from collections import defaultdict
 
+try:
+    from .analysis_common import (PARALLEL_MIN_FILES, compile_ascii_pattern, is_binary, iter_file_paths,
+                                  map_in_worker_processes)
+except ImportError:
+    from analysis_common import (PARALLEL_MIN_FILES, compile_ascii_pattern, is_binary, iter_file_paths,
+                                 map_in_worker_processes)
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# Use the libyaml-based dumper for YAML results when it is available
+try:
+    from yaml import CSafeDumper as YamlDumper
+except ImportError:
+    from yaml import SafeDumper as YamlDumper
+
+# File types that are analyzed
+ANALYZED_EXTENSIONS = ('.js', '.jsx', '.ts', '.tsx', '.py', '.html', '.css', '.scss')
+
+# Generated bundles are skipped; they are large and repeat their sources
+SKIPPED_SUFFIXES = ('.min.js', '.min.css', '.bundle.js')
+
+# Exclude patterns without any of these characters are plain name prefixes
+REGEX_METACHARS_RE = re.compile(r'[.^$*+?{}\[\]\\|()]')
+
+# Files larger than this are skipped by default
+DEFAULT_MAX_FILE_BYTES = 2_000_000
+
+# Patterns to identify testable elements
+TESTABLE_PATTERNS = {
+    'pricing_display': r'(price|cost|fee|charge|amount)\s*[=:]\s*[\'"]*(\d+(?:\.\d+)?)',
+    'cta_button': r'(button|btn|cta)\s*[=:]\s*[\'"]*([^\'"]*(sign\s*up|subscribe|buy|purchase|upgrade|try)[^\'"]*)[\'"]',
+    'feature_flag': r'(feature\s*flag|toggle|enabled?)\s*[=:]\s*[\'"]*(\w+)',
+    'checkout_flow': r'(checkout|payment|billing|cart)\s*[=:]\s*[\'"]*(\w+)',
+    'landing_page': r'(landing|homepage|sales\s*page)\s*[=:]\s*[\'"]*(\w+)',
+    'onboarding': r'(onboarding|welcome|tutorial|guide)\s*[=:]\s*[\'"]*(\w+)',
+    'upsell': r'(upsell|cross\s*sell|upgrade|premium)\s*[=:]\s*[\'"]*(\w+)'
+}
+
+# Element type names, interned so every element of a type shares one string
+ELEMENT_TYPES = tuple(sys.intern(element_type) for element_type in TESTABLE_PATTERNS)
+
+# Patterns to identify existing A/B tests
+EXISTING_TEST_PATTERNS = [
+    r'a\s*[/\\]\s*b\s*test',
+    r'ab\s*test',
+    r'split\s*test',
+    r'experiment\s*[=:]\s*[\'"]*(\w+)',
+    r'variant\s*[=:]\s*[\'"]*(\w+)',
+    r'control\s*[=:]\s*[\'"]*(\w+)',
+    r'treatment\s*[=:]\s*[\'"]*(\w+)'
+]
+
+def _dumps(obj, indent=False):
+    """Serialize an object to JSON bytes, with orjson when it is installed."""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else 0)
+    return json.dumps(obj, indent=2 if indent else None).encode('utf-8')
+
+def _loads(data):
+    """Parse JSON bytes, with orjson when it is installed."""
+    return orjson.loads(data) if ORJSON_AVAILABLE else json.loads(data)
+
+class ResultSpool:
+    """A list of result dicts kept in a temporary file instead of memory.
+    
+    Items are appended as JSON lines and read back on each iteration, so
+    memory use does not grow with the number of results.
+    """
+    
+    def __init__(self):
+        self._file = tempfile.TemporaryFile()
+        self._length = 0
+        self._at_end = True
+    
+    def append(self, item):
+        if not self._at_end:
+            self._file.seek(0, os.SEEK_END)
+            self._at_end = True
+        self._file.write(_dumps(item) + b'\n')
+        self._length += 1
+    
+    def extend(self, items):
+        for item in items:
+            self.append(item)
+    
+    def __iter__(self):
+        self._file.flush()
+        self._file.seek(0)
+        self._at_end = False
+        for line in self._file:
+            yield _loads(line)
+    
+    def __len__(self):
+        return self._length
+
+def _write_json_results(results, f):
+    """Write results to a binary file as JSON indented by two spaces.
+    
+    Lists and spools are written one item at a time, so a spooled list is
+    never loaded into memory as a whole.
+    """
+    if not results:
+        f.write(b'{}')
+        return
+    
+    separator = b'{\n  '
+    for key, value in results.items():
+        f.write(separator + _dumps(key) + b': ')
+        separator = b',\n  '
+        if isinstance(value, (list, ResultSpool)):
+            item_separator = b'[\n    '
+            for item in value:
+                f.write(item_separator + _dumps(item, indent=True).replace(b'\n', b'\n    '))
+                item_separator = b',\n    '
+            f.write(b'[]' if item_separator == b'[\n    ' else b'\n  ]')
+        else:
+            f.write(_dumps(value, indent=True).replace(b'\n', b'\n  '))
+    f.write(b'\n}')
+
 class ABTestingAnalyzer:
     """Analyzes the codebase to identify A/B testing opportunities."""
     
-    def __init__(self, verbose=False):
+    def __init__(self, verbose=False, max_file_bytes=DEFAULT_MAX_FILE_BYTES, include_context=True,
+                 low_memory=False, max_matches_per_pattern=0):
         self.verbose = verbose
+        self.max_file_bytes = max_file_bytes
+        # Most matches kept for each pattern in a file, 0 for no limit;
+        # scanning for a pattern stops once it is reached
+        self.max_matches_per_pattern = max_matches_per_pattern
+        # Whether each testable element keeps the source text around it;
+        # existing tests always do, since the report shows it
+        self.include_context = include_context
+        # Whether the result lists are kept in temporary files (ResultSpool)
+        # rather than in memory
+        self.low_memory = low_memory
         self.results = {
-            'testable_elements': [],
-            'existing_tests': [],
-            'test_opportunities': [],
+            'testable_elements': self._new_result_list(),
+            'existing_tests': self._new_result_list(),
+            'test_opportunities': self._new_result_list(),
             'summary': {
                 'total_testable_elements': 0,
                 'existing_tests': 0,
@@ -38,27 +177,33 @@ class ABTestingAnalyzer:
             }
         }
         
-        # Patterns to identify testable elements
+        # Number of test opportunities of each element type, and up to 3
+        # examples of each for the report; kept up to date as opportunities
+        # are generated so the report does not have to group them again
+        self._opportunity_counts = defaultdict(int)
+        self._opportunity_examples = defaultdict(list)
+        
+        # Matches found while scanning, kept as compact tuples until
+        # _generate_test_opportunities builds the result dicts from them:
+        # (type, file, line, match, context) for testable elements, with a
+        # context of None when it is not kept, and (file, line, match,
+        # context) for existing tests
+        self._found_elements = self._new_result_list()
+        self._found_tests = self._new_result_list()
+        
+        # Compile the patterns once; _analyze_file runs them on every file
         self.testable_patterns = {
-            'pricing_display': r'(price|cost|fee|charge|amount)\s*[=:]\s*[\'"]*(\d+(?:\.\d+)?)',
-            'cta_button': r'(button|btn|cta)\s*[=:]\s*[\'"]*([^\'"]*(sign\s*up|subscribe|buy|purchase|upgrade|try)[^\'"]*)[\'"]',
-            'feature_flag': r'(feature\s*flag|toggle|enabled?)\s*[=:]\s*[\'"]*(\w+)',
-            'checkout_flow': r'(checkout|payment|billing|cart)\s*[=:]\s*[\'"]*(\w+)',
-            'landing_page': r'(landing|homepage|sales\s*page)\s*[=:]\s*[\'"]*(\w+)',
-            'onboarding': r'(onboarding|welcome|tutorial|guide)\s*[=:]\s*[\'"]*(\w+)',
-            'upsell': r'(upsell|cross\s*sell|upgrade|premium)\s*[=:]\s*[\'"]*(\w+)'
+            element_type: re.compile(pattern, re.IGNORECASE)
+            for element_type, pattern in zip(ELEMENT_TYPES, TESTABLE_PATTERNS.values())
         }
+        self.existing_test_patterns = [re.compile(pattern, re.IGNORECASE) for pattern in EXISTING_TEST_PATTERNS]
         
-        # Patterns to identify existing A/B tests
-        self.existing_test_patterns = [
-            r'a\s*[/\\]\s*b\s*test',
-            r'ab\s*test',
-            r'split\s*test',
-            r'experiment\s*[=:]\s*[\'"]*(\w+)',
-            r'variant\s*[=:]\s*[\'"]*(\w+)',
-            r'control\s*[=:]\s*[\'"]*(\w+)',
-            r'treatment\s*[=:]\s*[\'"]*(\w+)'
-        ]
+        # The same patterns for matching lowercased ASCII files
+        self.ascii_testable_patterns = {
+            element_type: compile_ascii_pattern(pattern)
+            for element_type, pattern in zip(ELEMENT_TYPES, TESTABLE_PATTERNS.values())
+        }
+        self.ascii_existing_test_patterns = [compile_ascii_pattern(pattern) for pattern in EXISTING_TEST_PATTERNS]
         
         # A/B test experiment templates
         self.experiment_templates = {
@@ -176,8 +321,12 @@ class ABTestingAnalyzer:
             }
         }
     
-    def analyze_directory(self, directory_path, exclude_patterns=None):
-        """Analyze files in a directory to identify A/B testing opportunities."""
+    def analyze_directory(self, directory_path, exclude_patterns=None, jobs=1):
+        """Analyze files in a directory to identify A/B testing opportunities.
+        
+        With jobs > 1 and enough files, the files are scanned in that many
+        worker processes; results are merged in the same order either way.
+        """
         if exclude_patterns is None:
             exclude_patterns = ['node_modules', 'dist', 'build', '.git']
         
@@ -187,16 +336,32 @@ class ABTestingAnalyzer:
             print(f"Error: {directory_path} is not a directory")
             return
         
-        # Walk through the directory
-        for root, dirs, files in os.walk(directory_path):
-            # Skip excluded directories
-            dirs[:] = [d for d in dirs if not any(re.match(pattern, d) for pattern in exclude_patterns)]
-            
-            for file in files:
-                # Only analyze certain file types
-                if file.endswith(('.js', '.jsx', '.ts', '.tsx', '.py', '.html', '.css', '.scss')):
-                    file_path = Path(root) / file
-                    self._analyze_file(file_path)
+        # Exclude patterns are matched against the start of directory names.
+        # Plain names are all checked in one startswith call; only patterns
+        # that use regex syntax are compiled and matched.
+        exclude_prefixes = tuple(p for p in exclude_patterns if not REGEX_METACHARS_RE.search(p))
+        exclude_res = [re.compile(p) for p in exclude_patterns if REGEX_METACHARS_RE.search(p)]
+        
+        def is_excluded_dir(entry):
+            name = entry.name
+            return name.startswith(exclude_prefixes) or any(r.match(name) for r in exclude_res)
+        
+        # Walk through the directory, analyzing only certain file types and
+        # not generated bundles
+        file_paths = [Path(file_path) for file_path in iter_file_paths(
+            directory_path, is_excluded_dir,
+            lambda name: name.endswith(ANALYZED_EXTENSIONS) and not name.endswith(SKIPPED_SUFFIXES),
+            self.max_file_bytes, self.verbose)]
+        
+        if jobs > 1 and len(file_paths) >= PARALLEL_MIN_FILES:
+            scans = map_in_worker_processes(self, '_scan_file', file_paths, jobs, verbose=self.verbose,
+                                            include_context=self.include_context,
+                                            max_matches_per_pattern=self.max_matches_per_pattern)
+            for file_path, (testable_elements, existing_tests) in zip(file_paths, scans):
+                self._add_file_results(file_path, testable_elements, existing_tests)
+        else:
+            for file_path in file_paths:
+                self._analyze_file(file_path)
         
         # Generate test opportunities based on testable elements and existing tests
         self._generate_test_opportunities()
@@ -211,72 +376,159 @@ class ABTestingAnalyzer:
     
     def _analyze_file(self, file_path):
         """Analyze a file to identify testable elements and existing tests."""
+        self._add_file_results(file_path, *self._scan_file(file_path))
+    
+    def _new_result_list(self):
+        """Return an empty result list, spooled to disk in low-memory mode."""
+        return ResultSpool() if self.low_memory else []
+    
+    def _add_file_results(self, file_path, testable_elements, existing_tests):
+        """Add the testable elements and existing tests found in a file to the results."""
+        self._found_elements.extend(testable_elements)
+        self._found_tests.extend(existing_tests)
+        
+        if self.verbose and (len(self._found_elements) > 0 or len(self._found_tests) > 0):
+            print(f"Analyzed {file_path}")
+    
+    def _scan_file(self, file_path):
+        """Find the testable elements and existing tests in a file.
+        
+        Returns a (testable elements, existing tests) tuple of lists of match
+        tuples, laid out as described in __init__. This does not touch the
+        analyzer's state, so it can run in a worker process.
+        """
+        testable_elements = []
+        existing_tests = []
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
+            with open(file_path, 'rb') as f:
                 content = f.read()
             
+            # Skip binary files
+            if is_binary(content):
+                if self.verbose:
+                    print(f"Skipping binary file {file_path}")
+                return testable_elements, existing_tests
+            
+            # Translate newlines the way text mode would
+            if b'\r' in content:
+                content = content.replace(b'\r\n', b'\n').replace(b'\r', b'\n')
+            
+            # ASCII files are matched as bytes, with case folded once for the
+            # whole file: lowercasing ASCII keeps every offset, so matches map
+            # straight back onto content, and only the text kept from it is
+            # decoded. Other files are decoded and matched case-insensitively.
+            if content.isascii():
+                text = content.lower()
+                newline = b'\n'
+                decode = bytes.decode
+                testable_patterns = self.ascii_testable_patterns
+                existing_test_patterns = self.ascii_existing_test_patterns
+            else:
+                content = text = content.decode('utf-8')
+                newline = '\n'
+                decode = str
+                testable_patterns = self.testable_patterns
+                existing_test_patterns = self.existing_test_patterns
+            
+            # Offsets of the newlines, so line numbers are found by bisection;
+            # an array keeps them unboxed, at 8 bytes each
+            newlines = array('Q')
+            index = content.find(newline)
+            while index >= 0:
+                newlines.append(index)
+                index = content.find(newline, index + 1)
+            
+            # Per-file values, looked up once instead of for every match; the
+            # file name is interned so elements and tests in the same file
+            # share it, and compare by identity when grouped by file
+            file_name = sys.intern(str(file_path))
+            include_context = self.include_context
+            max_matches = self.max_matches_per_pattern or None
+            add_element = testable_elements.append
+            add_test = existing_tests.append
+            
+            # Only the context (a few lines around the match) is sliced from
+            # content and decoded; the match text is cut out of the context,
+            # so no more of the file is copied than is kept
+            
             # Look for testable elements
-            for element_type, pattern in self.testable_patterns.items():
-                for match in re.finditer(pattern, content, re.IGNORECASE):
-                    # Get context (a few lines around the match)
-                    start_pos = max(0, match.start() - 100)
-                    end_pos = min(len(content), match.end() + 100)
-                    context = content[start_pos:end_pos]
-                    
-                    # Get line number
-                    line_number = content[:match.start()].count('\n') + 1
+            for element_type, pattern in testable_patterns.items():
+                for match in islice(pattern.finditer(text), max_matches):
+                    start, end = match.span()
+                    line = bisect_right(newlines, start) + 1
                     
-                    self.results['testable_elements'].append({
-                        'type': element_type,
-                        'file': str(file_path),
-                        'line': line_number,
-                        'match': match.group(0),
-                        'context': context,
-                        'already_tested': False  # Will be updated later
-                    })
+                    if include_context:
+                        context_start = max(0, start - 100)
+                        context = decode(content[context_start:end + 100])
+                        add_element((element_type, file_name, line,
+                                     context[start - context_start:end - context_start], context))
+                    else:
+                        add_element((element_type, file_name, line, decode(content[start:end]), None))
             
             # Look for existing A/B tests
-            for pattern in self.existing_test_patterns:
-                for match in re.finditer(pattern, content, re.IGNORECASE):
-                    # Get context (a few lines around the match)
-                    start_pos = max(0, match.start() - 100)
-                    end_pos = min(len(content), match.end() + 100)
-                    context = content[start_pos:end_pos]
+            for pattern in existing_test_patterns:
+                for match in islice(pattern.finditer(text), max_matches):
+                    start, end = match.span()
+                    context_start = max(0, start - 100)
+                    context = decode(content[context_start:end + 100])
                     
-                    # Get line number
-                    line_number = content[:match.start()].count('\n') + 1
-                    
-                    self.results['existing_tests'].append({
-                        'file': str(file_path),
-                        'line': line_number,
-                        'match': match.group(0),
-                        'context': context
-                    })
-            
-            if self.verbose and (len(self.results['testable_elements']) > 0 or len(self.results['existing_tests']) > 0):
-                print(f"Analyzed {file_path}")
+                    add_test((file_name, bisect_right(newlines, start) + 1,
+                              context[start - context_start:end - context_start], context))
         
         except Exception as e:
             print(f"Error analyzing {file_path}: {e}")
+        
+        return testable_elements, existing_tests
     
     def _generate_test_opportunities(self):
         """Generate test opportunities based on testable elements and existing tests."""
-        # Mark elements that are already being tested
-        for element in self.results['testable_elements']:
-            for test in self.results['existing_tests']:
-                # If the element and test are in the same file and close to each other
-                if element['file'] == test['file'] and abs(element['line'] - test['line']) < 10:
-                    element['already_tested'] = True
-                    break
+        # Build the existing test dicts from the matches found
+        existing_tests = self.results['existing_tests']
+        for file_name, line, match, context in self._found_tests:
+            existing_tests.append({
+                'file': file_name,
+                'line': line,
+                'match': match,
+                'context': context
+            })
+        self._found_tests = self._new_result_list()
         
-        # Generate test opportunities for untested elements
-        for element in self.results['testable_elements']:
+        # Lines of the existing tests in each file, sorted
+        test_lines_by_file = defaultdict(list)
+        for test in existing_tests:
+            test_lines_by_file[test['file']].append(test['line'])
+        for lines in test_lines_by_file.values():
+            lines.sort()
+        
+        testable_elements = self.results['testable_elements']
+        for element_type, file_name, line, match, context in self._found_elements:
+            element = {
+                'type': element_type,
+                'file': file_name,
+                'line': line,
+                'match': match
+            }
+            if context is not None:
+                element['context'] = context
+            
+            # Mark elements that are already being tested
+            element['already_tested'] = False
+            lines = test_lines_by_file.get(file_name)
+            if lines:
+                # If a test in the same file is close to the element; only
+                # the nearest test on either side needs checking
+                i = bisect_left(lines, line)
+                if (i < len(lines) and lines[i] - line < 10) or (i > 0 and line - lines[i - 1] < 10):
+                    element['already_tested'] = True
+            testable_elements.append(element)
+            
+            # Generate test opportunities for untested elements
             if not element['already_tested']:
                 # Get the template for this element type
                 template = self.experiment_templates.get(element['type'])
                 
                 if template:
-                    self.results['test_opportunities'].append({
+                    opportunity = {
                         'element': element,
                         'experiment': {
                             'name': template['name'],
@@ -285,7 +537,15 @@ class ABTestingAnalyzer:
                             'metrics': template['metrics'],
                             'implementation_complexity': template['implementation_complexity']
                         }
-                    })
+                    }
+                    self.results['test_opportunities'].append(opportunity)
+                    
+                    self._opportunity_counts[element['type']] += 1
+                    examples = self._opportunity_examples[element['type']]
+                    if len(examples) < 3:
+                        examples.append(opportunity)
+        
+        self._found_elements = self._new_result_list()
     
     def _calculate_summary(self):
         """Calculate summary statistics."""
@@ -301,107 +561,113 @@ class ABTestingAnalyzer:
     
     def save_results(self, output_file, format='json'):
         """Save analysis results to a file."""
-        with open(output_file, 'w', encoding='utf-8') as f:
-            if format == 'json':
-                json.dump(self.results, f, indent=2)
-            elif format == 'yaml':
-                yaml.dump(self.results, f, sort_keys=False)
+        if format == 'json':
+            with open(output_file, 'wb') as f:
+                _write_json_results(self.results, f)
+        elif format == 'yaml':
+            # YAML is written in one go, so spooled lists are loaded here
+            results = {key: list(value) if isinstance(value, ResultSpool) else value
+                       for key, value in self.results.items()}
+            with open(output_file, 'w', encoding='utf-8') as f:
+                yaml.dump(results, f, Dumper=YamlDumper, sort_keys=False)
         
         print(f"Saved A/B testing analysis results to {output_file}")
     
     def generate_report(self, output_file):
         """Generate a human-readable report."""
-        with open(output_file, 'w', encoding='utf-8') as f:
-            f.write("# A/B Testing Opportunities Report\n\n")
+        # Build the report in memory and write it in one call
+        parts = []
+        write = parts.append
+        
+        write("# A/B Testing Opportunities Report\n\n")
+        
+        # Write summary
+        write("## Summary\n\n")
+        write(f"- Total testable elements: {self.results['summary']['total_testable_elements']}\n")
+        write(f"- Existing A/B tests: {self.results['summary']['existing_tests']}\n")
+        write(f"- Test opportunities: {self.results['summary']['test_opportunities']}\n\n")
+        
+        # Write test opportunities by type
+        write("## Test Opportunities by Type\n\n")
+        
+        # Write each type
+        for element_type, opportunities in self._opportunity_examples.items():
+            count = self._opportunity_counts[element_type]
+            write(f"### {element_type.replace('_', ' ').title()} ({count})\n\n")
             
-            # Write summary
-            f.write("## Summary\n\n")
-            f.write(f"- Total testable elements: {self.results['summary']['total_testable_elements']}\n")
-            f.write(f"- Existing A/B tests: {self.results['summary']['existing_tests']}\n")
-            f.write(f"- Test opportunities: {self.results['summary']['test_opportunities']}\n\n")
+            # Take the first opportunity as an example
+            example = opportunities[0]
             
-            # Write test opportunities by type
-            f.write("## Test Opportunities by Type\n\n")
+            write(f"**Experiment**: {example['experiment']['name']}\n\n")
+            write(f"**Description**: {example['experiment']['description']}\n\n")
             
-            # Group opportunities by type
-            opportunities_by_type = defaultdict(list)
-            for opportunity in self.results['test_opportunities']:
-                opportunities_by_type[opportunity['element']['type']].append(opportunity)
+            write("**Variants**:\n")
+            for variant in example['experiment']['variants']:
+                write(f"- {variant}\n")
             
-            # Write each type
-            for element_type, opportunities in opportunities_by_type.items():
-                f.write(f"### {element_type.replace('_', ' ').title()} ({len(opportunities)})\n\n")
-                
-                # Take the first opportunity as an example
-                example = opportunities[0]
-                
-                f.write(f"**Experiment**: {example['experiment']['name']}\n\n")
-                f.write(f"**Description**: {example['experiment']['description']}\n\n")
-                
-                f.write("**Variants**:\n")
-                for variant in example['experiment']['variants']:
-                    f.write(f"- {variant}\n")
-                
-                f.write("\n**Metrics**:\n")
-                for metric in example['experiment']['metrics']:
-                    f.write(f"- {metric}\n")
-                
-                f.write(f"\n**Implementation Complexity**: {example['experiment']['implementation_complexity']}\n\n")
-                
-                f.write("**Example Locations**:\n")
-                for opportunity in opportunities[:3]:  # Show up to 3 examples
-                    element = opportunity['element']
-                    f.write(f"- {element['file']}:{element['line']} - `{element['match']}`\n")
-                
-                if len(opportunities) > 3:
-                    f.write(f"- ... and {len(opportunities) - 3} more\n")
-                
-                f.write("\n")
+            write("\n**Metrics**:\n")
+            for metric in example['experiment']['metrics']:
+                write(f"- {metric}\n")
             
-            # Write existing tests
-            if self.results['existing_tests']:
-                f.write("## Existing A/B Tests\n\n")
-                
-                for test in self.results['existing_tests']:
-                    f.write(f"### {test['file']}:{test['line']}\n\n")
-                    f.write(f"```\n{test['context']}\n```\n\n")
+            write(f"\n**Implementation Complexity**: {example['experiment']['implementation_complexity']}\n\n")
             
-            # Write implementation guide
-            f.write("## A/B Testing Implementation Guide\n\n")
+            write("**Example Locations**:\n")
+            for opportunity in opportunities:  # Show up to 3 examples
+                element = opportunity['element']
+                write(f"- {element['file']}:{element['line']} - `{element['match']}`\n")
             
-            f.write("### General Implementation Steps\n\n")
-            f.write("1. **Define the hypothesis**\n")
-            f.write("   - What do you expect to improve?\n")
-            f.write("   - What is the expected outcome?\n\n")
-            f.write("2. **Determine sample size**\n")
-            f.write("   - Use a sample size calculator\n")
-            f.write("   - Consider statistical significance\n\n")
-            f.write("3. **Implement the test**\n")
-            f.write("   - Use a testing framework (e.g., Optimizely, Google Optimize)\n")
-            f.write("   - Ensure proper tracking is in place\n\n")
-            f.write("4. **Run the test**\n")
-            f.write("   - Run until statistical significance is reached\n")
-            f.write("   - Avoid making other changes during the test\n\n")
-            f.write("5. **Analyze results**\n")
-            f.write("   - Look at primary and secondary metrics\n")
-            f.write("   - Segment results by user type if possible\n\n")
-            f.write("6. **Implement the winner**\n")
-            f.write("   - Roll out the winning variant\n")
-            f.write("   - Document learnings for future tests\n\n")
+            if count > 3:
+                write(f"- ... and {count - 3} more\n")
             
-            f.write("### Recommended Testing Tools\n\n")
-            f.write("- **Client-side testing**: Google Optimize, Optimizely, VWO\n")
-            f.write("- **Server-side testing**: LaunchDarkly, Split.io, Flagsmith\n")
-            f.write("- **Mobile app testing**: Firebase A/B Testing, Apptimize\n")
-            f.write("- **Analytics integration**: Google Analytics, Mixpanel, Amplitude\n\n")
+            write("\n")
+        
+        # Write existing tests
+        if self.results['existing_tests']:
+            write("## Existing A/B Tests\n\n")
             
-            f.write("### Best Practices\n\n")
-            f.write("- Test one thing at a time for clear results\n")
-            f.write("- Run tests for at least 1-2 weeks to account for day-of-week effects\n")
-            f.write("- Aim for at least 100 conversions per variant before concluding\n")
-            f.write("- Document all tests, even failed ones, to build institutional knowledge\n")
-            f.write("- Consider segmenting results by user type, device, or traffic source\n")
-            f.write("- Prioritize tests with high potential impact and low implementation cost\n")
+            for test in self.results['existing_tests']:
+                write(f"### {test['file']}:{test['line']}\n\n")
+                write(f"```\n{test['context']}\n```\n\n")
+        
+        # Write implementation guide
+        write("## A/B Testing Implementation Guide\n\n")
+        
+        write("### General Implementation Steps\n\n")
+        write("1. **Define the hypothesis**\n")
+        write("   - What do you expect to improve?\n")
+        write("   - What is the expected outcome?\n\n")
+        write("2. **Determine sample size**\n")
+        write("   - Use a sample size calculator\n")
+        write("   - Consider statistical significance\n\n")
+        write("3. **Implement the test**\n")
+        write("   - Use a testing framework (e.g., Optimizely, Google Optimize)\n")
+        write("   - Ensure proper tracking is in place\n\n")
+        write("4. **Run the test**\n")
+        write("   - Run until statistical significance is reached\n")
+        write("   - Avoid making other changes during the test\n\n")
+        write("5. **Analyze results**\n")
+        write("   - Look at primary and secondary metrics\n")
+        write("   - Segment results by user type if possible\n\n")
+        write("6. **Implement the winner**\n")
+        write("   - Roll out the winning variant\n")
+        write("   - Document learnings for future tests\n\n")
+        
+        write("### Recommended Testing Tools\n\n")
+        write("- **Client-side testing**: Google Optimize, Optimizely, VWO\n")
+        write("- **Server-side testing**: LaunchDarkly, Split.io, Flagsmith\n")
+        write("- **Mobile app testing**: Firebase A/B Testing, Apptimize\n")
+        write("- **Analytics integration**: Google Analytics, Mixpanel, Amplitude\n\n")
+        
+        write("### Best Practices\n\n")
+        write("- Test one thing at a time for clear results\n")
+        write("- Run tests for at least 1-2 weeks to account for day-of-week effects\n")
+        write("- Aim for at least 100 conversions per variant before concluding\n")
+        write("- Document all tests, even failed ones, to build institutional knowledge\n")
+        write("- Consider segmenting results by user type, device, or traffic source\n")
+        write("- Prioritize tests with high potential impact and low implementation cost\n")
+        
+        with open(output_file, 'w', encoding='utf-8') as f:
+            f.write(''.join(parts))
         
         print(f"Generated A/B testing report at {output_file}")
 
@@ -413,11 +679,23 @@ def main():
     parser.add_argument("--report", help="Generate human-readable report")
     parser.add_argument("--exclude", nargs="+", default=["node_modules", "dist", "build", ".git"],
                         help="Patterns to exclude (default: node_modules dist build .git)")
+    parser.add_argument("--max-file-size", type=int, default=DEFAULT_MAX_FILE_BYTES,
+                        help=f"Skip files larger than this many bytes, 0 for no limit (default: {DEFAULT_MAX_FILE_BYTES})")
+    parser.add_argument("--no-context", action="store_true",
+                        help="Do not store the surrounding source with each testable element")
+    parser.add_argument("--low-memory", action="store_true",
+                        help="Keep matches in temporary files instead of memory (YAML output still loads them)")
+    parser.add_argument("--max-matches-per-pattern", type=int, default=0,
+                        help="Keep at most this many matches of each pattern per file, 0 for no limit (default: 0)")
+    parser.add_argument("--jobs", "-j", type=int, default=os.cpu_count() or 1,
+                        help="Number of worker processes used to scan files (default: number of CPUs)")
     parser.add_argument("--verbose", action="store_true", help="Enable verbose output")
     args = parser.parse_args()
     
-    analyzer = ABTestingAnalyzer(verbose=args.verbose)
-    analyzer.analyze_directory(args.source_dir, exclude_patterns=args.exclude)
+    analyzer = ABTestingAnalyzer(verbose=args.verbose, max_file_bytes=args.max_file_size,
+                                 include_context=not args.no_context, low_memory=args.low_memory,
+                                 max_matches_per_pattern=args.max_matches_per_pattern)
+    analyzer.analyze_directory(args.source_dir, exclude_patterns=args.exclude, jobs=args.jobs)
     analyzer.save_results(args.output, format=args.format)
     
     if args.report:
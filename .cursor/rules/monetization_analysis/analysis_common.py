@@ -0,0 +1,204 @@
+#!/usr/bin/env python3
+
+"""Shared Helpers for the Monetization Analyzers
+
+File discovery, binary file detection, pattern compilation for ASCII files
+and worker-process setup used by the analyzer scripts in this directory,
+which import it as a sibling module.
+
+Maturity: beta
+
+Why:
+- Keeps the directory walker and its exclude rules in one place
+- Gives every analyzer the same binary file and worker pool handling
+"""
+
+import multiprocessing
+import os
+import re
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+
+try:
+    import re2
+    RE2_AVAILABLE = True
+except ImportError:
+    RE2_AVAILABLE = False
+
+# Files with a NUL byte this close to the start are treated as binary
+BINARY_SNIFF_BYTES = 4096
+
+# What \s matches in a str pattern among ASCII characters; in bytes patterns
+# neither re nor RE2 match \x1c-\x1f with \s, and RE2 not \v either
+ASCII_WHITESPACE = r'\t\n\x0b\x0c\r\x1c-\x1f '
+
+# Below this many files a process pool costs more than it saves
+PARALLEL_MIN_FILES = 200
+# Files handed to a worker process at a time
+PARALLEL_CHUNK_SIZE = 32
+
+def is_binary(content):
+    """Return whether file contents, as bytes, look like a binary file."""
+    return content.find(b'\x00', 0, BINARY_SNIFF_BYTES) >= 0
+
+def compile_ascii_pattern(pattern):
+    """Compile a lowercase str pattern for matching lowercased ASCII bytes.
+    
+    The result finds the same matches in a lowercased ASCII file as the
+    pattern compiled with re.IGNORECASE does in the decoded text, and is
+    several times faster to scan with, since re can skip ahead to the
+    pattern's first characters. \\s and \\S are spelled out as the ASCII
+    whitespace \\s matches in a str pattern. RE2 is used when it is
+    installed and supports the pattern; it also runs in linear time where re
+    would backtrack.
+    """
+    pattern = _spell_out_whitespace(pattern).encode('ascii')
+    if RE2_AVAILABLE:
+        try:
+            return re2.compile(pattern)
+        except re2.error:
+            pass
+    return re.compile(pattern)
+
+def _spell_out_whitespace(pattern):
+    """Replace \\s and \\S in a pattern with ASCII_WHITESPACE classes.
+    
+    Within a character class \\s adds its characters to the class; \\S is
+    only rewritten outside one.
+    """
+    parts = []
+    in_class = False
+    i = 0
+    while i < len(pattern):
+        char = pattern[i]
+        if char == '\\':
+            escape = pattern[i:i + 2]
+            if escape == r'\s':
+                escape = ASCII_WHITESPACE if in_class else f'[{ASCII_WHITESPACE}]'
+            elif escape == r'\S' and not in_class:
+                escape = f'[^{ASCII_WHITESPACE}]'
+            parts.append(escape)
+            i += 2
+            continue
+        
+        parts.append(char)
+        i += 1
+        if char == '[' and not in_class:
+            in_class = True
+            # A leading ^ negates the class, and a ] right after it is literal
+            if pattern.startswith('^', i):
+                parts.append('^')
+                i += 1
+            if pattern.startswith(']', i):
+                parts.append(']')
+                i += 1
+        elif char == ']' and in_class:
+            in_class = False
+    
+    return ''.join(parts)
+
+def path_pattern_excluder(top_directory, exclude_patterns):
+    """Return a predicate telling whether a directory entry is excluded.
+    
+    A directory is excluded when any of exclude_patterns occurs anywhere in
+    its path. Excluded directories are never entered, so once the top
+    directory's path is clear of the patterns one can only match within a
+    subdirectory's name, or across a separator if it contains one; only
+    those are checked. If the top directory's path has a pattern in it, so
+    does every subdirectory's, and all of them are excluded.
+    """
+    if any(pattern in top_directory for pattern in exclude_patterns):
+        return lambda entry: True
+    
+    exclude_names = tuple(p for p in exclude_patterns if os.sep not in p)
+    exclude_paths = tuple(p for p in exclude_patterns if os.sep in p)
+    
+    def is_excluded(entry):
+        name = entry.name
+        return any(pattern in name for pattern in exclude_names) \
+            or any(pattern in entry.path for pattern in exclude_paths)
+    
+    return is_excluded
+
+def iter_file_paths(directory, is_excluded_dir, is_analyzed_file, max_file_bytes=0, verbose=False):
+    """Yield the paths of the files to analyze under a directory, as strings.
+    
+    is_excluded_dir is called with the DirEntry of each subdirectory and
+    is_analyzed_file with the name of each file. Files larger than
+    max_file_bytes, when it is not 0, are skipped using the size the entry
+    already has. Files come in the order os.walk would give them: a
+    directory's own files first, then each subdirectory in turn. Symlinked
+    directories are not followed.
+    """
+    try:
+        with os.scandir(directory) as it:
+            entries = list(it)
+    except OSError:
+        return
+    
+    subdirs = []
+    for entry in entries:
+        try:
+            is_dir = entry.is_dir()
+        except OSError:
+            is_dir = False
+        
+        if is_dir:
+            # Skip excluded directories
+            if not is_excluded_dir(entry) and not entry.is_symlink():
+                subdirs.append(entry.path)
+        
+        # Only process relevant file types
+        elif is_analyzed_file(entry.name):
+            if max_file_bytes and file_size(entry) > max_file_bytes:
+                if verbose:
+                    print(f"Skipping {entry.path}: larger than {max_file_bytes} bytes")
+                continue
+            yield entry.path
+    
+    for subdir in subdirs:
+        yield from iter_file_paths(subdir, is_excluded_dir, is_analyzed_file, max_file_bytes, verbose)
+
+def file_size(entry):
+    """Return the size of a directory entry's file, or 0 if it cannot be determined."""
+    try:
+        return entry.stat().st_size
+    except OSError:
+        return 0
+
+def map_in_worker_processes(analyzer, method_name, file_paths, jobs, **analyzer_kwargs):
+    """Call an analyzer method on each file in a pool of worker processes.
+    
+    Yields the results in file order. Forked workers inherit the analyzer,
+    compiled patterns and all, so nothing is pickled or compiled again
+    (some, such as a Hyperscan database, cannot be pickled); where fork is
+    not available each worker creates its own from analyzer_kwargs.
+    """
+    if 'fork' in multiprocessing.get_all_start_methods():
+        mp_context = multiprocessing.get_context('fork')
+        shared_analyzer = analyzer
+    else:
+        mp_context = None
+        shared_analyzer = None
+    
+    with ProcessPoolExecutor(max_workers=jobs, mp_context=mp_context, initializer=_init_worker,
+                             initargs=(shared_analyzer, type(analyzer), analyzer_kwargs)) as executor:
+        yield from executor.map(partial(_call_worker_analyzer, method_name), file_paths,
+                                chunksize=PARALLEL_CHUNK_SIZE)
+
+# Analyzer used by a pool worker process, created once per process
+_worker_analyzer = None
+
+def _init_worker(analyzer, analyzer_class, analyzer_kwargs):
+    """Set up the analyzer used by this worker process.
+    
+    A forked worker is given the parent's analyzer; otherwise one is created.
+    """
+    global _worker_analyzer
+    if analyzer is None:
+        analyzer = analyzer_class(**analyzer_kwargs)
+    _worker_analyzer = analyzer
+
+def _call_worker_analyzer(method_name, file_path):
+    """Call a method of this worker's analyzer on a single file."""
+    return getattr(_worker_analyzer, method_name)(file_path)
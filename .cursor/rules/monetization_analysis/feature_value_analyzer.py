@@ -16,17 +16,86 @@ Why:
 
 import argparse
 import json
+import mmap
 import os
 import re
+import sys
+from array import array
+from bisect import bisect_right
+from itertools import islice
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 import yaml
 from collections import defaultdict
 
+try:
+    from .analysis_common import (PARALLEL_MIN_FILES, compile_ascii_pattern, is_binary, iter_file_paths,
+                                  map_in_worker_processes, path_pattern_excluder)
+except ImportError:
+    from analysis_common import (PARALLEL_MIN_FILES, compile_ascii_pattern, is_binary, iter_file_paths,
+                                 map_in_worker_processes, path_pattern_excluder)
+
+try:
+    import hyperscan
+    HYPERSCAN_AVAILABLE = True
+except ImportError:
+    HYPERSCAN_AVAILABLE = False
+
+try:
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
+
+try:
+    import liburing
+    LIBURING_AVAILABLE = True
+except ImportError:
+    LIBURING_AVAILABLE = False
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# Use the libyaml-based dumper for YAML results when it is available
+try:
+    from yaml import CSafeDumper as YamlDumper
+except ImportError:
+    from yaml import SafeDumper as YamlDumper
+
+# File types that are analyzed
+ANALYZED_EXTENSIONS = ('.js', '.jsx', '.ts', '.tsx', '.py', '.md')
+
+# Files larger than this are skipped by default
+DEFAULT_MAX_FILE_BYTES = 2_000_000
+
+# Files at least this large are memory-mapped rather than read, and scanned
+# in place where they need no decoding or newline translation
+MMAP_MIN_BYTES = 64 * 1024
+NON_ASCII_RE = re.compile(rb'[^\x00-\x7f]')
+
+# A feature pattern that is a plain alternation of keywords, which can be
+# matched with Hyperscan or an Aho-Corasick automaton instead of a regex
+KEYWORD_ALTERNATION_RE = re.compile(r'\(([A-Za-z0-9_]+(?:\|[A-Za-z0-9_]+)*)\)')
+
+# When scanning in this process, files are read ahead of the scan: in
+# batches of READ_AHEAD_FILES with io_uring, or otherwise by READ_THREADS
+# threads with at most READ_AHEAD_FILES read but not yet scanned
+READ_THREADS = 4
+READ_AHEAD_FILES = 16
+
 class FeatureValueAnalyzer:
     """Analyzes features in the codebase to estimate their potential value."""
     
-    def __init__(self, verbose=False):
+    def __init__(self, verbose=False, max_file_bytes=DEFAULT_MAX_FILE_BYTES, max_occurrences=0):
         self.verbose = verbose
+        self.max_file_bytes = max_file_bytes
+        # Most occurrences stored for each feature, 0 for no limit; the
+        # rest are only counted, which is all the scoring needs
+        self.max_occurrences = max_occurrences
         self.results = {
             'features': [],
             'summary': {
@@ -149,6 +218,23 @@ class FeatureValueAnalyzer:
             }
         }
         
+        # Compile the patterns once; _identify_features runs them on every
+        # file, the ascii_compiled form on lowercased ASCII files
+        for feature_info in self.feature_patterns.values():
+            feature_info['compiled'] = re.compile(feature_info['pattern'], re.IGNORECASE)
+            feature_info['ascii_compiled'] = compile_ascii_pattern(feature_info['pattern'])
+        
+        # ASCII files are instead scanned once for the keywords of every
+        # pattern, with Hyperscan or else pyahocorasick when installed
+        self._feature_keywords = self._parse_feature_keywords()
+        self._keyword_database = None
+        self._keyword_automaton = None
+        if self._feature_keywords is not None:
+            if HYPERSCAN_AVAILABLE:
+                self._keyword_database = self._build_keyword_database()
+            elif AHOCORASICK_AVAILABLE:
+                self._keyword_automaton = self._build_keyword_automaton()
+        
         # Value factor weights
         self.value_factor_weights = {
             'conversion_impact': 0.3,
@@ -165,9 +251,32 @@ class FeatureValueAnalyzer:
             'high': 4,
             'very_high': 5
         }
+        
+        # Weighted score of every (factor, rating) pair, so scoring a set of
+        # value factors is a sum of table lookups
+        self._weighted_factor_scores = {
+            factor: {rating: weight * score for rating, score in self.value_factor_scores.items()}
+            for factor, weight in self.value_factor_weights.items()
+        }
+        
+        # Each feature's value factors are fixed, so its raw value score is
+        # calculated once here; only the completeness adjustment depends on
+        # what is found
+        self._raw_value_scores = {
+            feature_name: self._raw_value_score(feature_info['value_factors'])
+            for feature_name, feature_info in self.feature_patterns.items()
+        }
+        
+        # Features of each value category, highest value first; filled in by
+        # _calculate_summary and used by the report
+        self._features_by_category = {'high': [], 'medium': [], 'low': []}
     
-    def analyze_directory(self, directory_path, exclude_patterns=None):
-        """Analyze files in a directory to identify and value features."""
+    def analyze_directory(self, directory_path, exclude_patterns=None, jobs=1):
+        """Analyze files in a directory to identify and value features.
+        
+        With jobs > 1 and enough files, the files are scanned in that many
+        worker processes; results are merged in the same order either way.
+        """
         if exclude_patterns is None:
             exclude_patterns = ['node_modules', 'dist', 'build', '.git']
         
@@ -177,22 +286,15 @@ class FeatureValueAnalyzer:
             print(f"Error: {directory_path} is not a directory")
             return
         
-        # First pass: collect all files
-        files = []
-        
-        for root, dirs, filenames in os.walk(directory_path):
-            # Skip excluded directories
-            dirs[:] = [d for d in dirs if not any(pattern in str(Path(root) / d) for pattern in exclude_patterns)]
-            
-            for file in filenames:
-                file_path = Path(root) / file
-                
-                # Only process relevant file types
-                if file.endswith(('.js', '.jsx', '.ts', '.tsx', '.py', '.md')):
-                    files.append(file_path)
+        # First pass: collect all files; exclude patterns may match anywhere
+        # in a directory's path
+        top_directory = str(directory_path)
+        files = list(iter_file_paths(top_directory, path_pattern_excluder(top_directory, exclude_patterns),
+                                     lambda name: name.endswith(ANALYZED_EXTENSIONS),
+                                     self.max_file_bytes, self.verbose))
         
         # Second pass: identify features
-        self._identify_features(files)
+        self._identify_features(files, jobs=jobs)
         
         # Third pass: calculate feature values
         self._calculate_feature_values()
@@ -200,72 +302,337 @@ class FeatureValueAnalyzer:
         # Calculate summary
         self._calculate_summary()
     
-    def _identify_features(self, files):
-        """Identify features in files."""
-        # Initialize feature occurrences
-        feature_occurrences = defaultdict(list)
+    def _parse_feature_keywords(self):
+        """Split the feature patterns into their keywords.
         
-        for file_path in files:
-            try:
-                with open(file_path, 'r', encoding='utf-8') as f:
-                    content = f.read()
+        Returns a list of (feature name, alternative, keyword) tuples, where
+        alternative is the keyword's position in its pattern, or None if a
+        pattern is not a plain alternation of keywords.
+        """
+        feature_keywords = []
+        for feature_name, feature_info in self.feature_patterns.items():
+            match = KEYWORD_ALTERNATION_RE.fullmatch(feature_info['pattern'])
+            if not match:
+                return None
+            for alternative, keyword in enumerate(match.group(1).lower().split('|')):
+                feature_keywords.append((feature_name, alternative, keyword))
+        return feature_keywords
+    
+    def _build_keyword_database(self):
+        """Compile a Hyperscan database matching every feature keyword, ignoring case."""
+        database = hyperscan.Database()
+        database.compile(
+            expressions=[keyword.encode('ascii') for _, _, keyword in self._feature_keywords],
+            ids=list(range(len(self._feature_keywords))),
+            elements=len(self._feature_keywords),
+            flags=[hyperscan.HS_FLAG_CASELESS] * len(self._feature_keywords)
+        )
+        return database
+    
+    def _build_keyword_automaton(self):
+        """Build an Aho-Corasick automaton over the lowercased feature keywords."""
+        # Features (and the position of the keyword in their alternation)
+        # by keyword
+        keywords = defaultdict(list)
+        for feature_name, alternative, keyword in self._feature_keywords:
+            keywords[keyword].append((feature_name, alternative, len(keyword)))
+        
+        automaton = ahocorasick.Automaton()
+        for keyword, features in keywords.items():
+            automaton.add_word(keyword, features)
+        automaton.make_automaton()
+        return automaton
+    
+    def _find_feature_matches(self, content):
+        """Find the feature pattern matches in a file's content.
+        
+        content is bytes (or a mapped file) for ASCII files and str for
+        others. Yields (feature
+        name, start, end) tuples, feature by feature in the order of
+        self.feature_patterns and in file order within a feature.
+        """
+        # ASCII files are scanned for keywords, or lowercased once and
+        # matched case-sensitively; either way offsets into the scanned text
+        # are offsets into content. Other files are matched case-insensitively.
+        if not isinstance(content, str):
+            if self._keyword_database is not None:
+                yield from self._select_keyword_matches(self._scan_keyword_database(content))
+                return
+            text = content.lower()
+            if self._keyword_automaton is not None:
+                yield from self._select_keyword_matches(self._scan_keyword_automaton(text.decode('ascii')))
+                return
+            pattern_key = 'ascii_compiled'
+        else:
+            text = content
+            pattern_key = 'compiled'
+        
+        for feature_name, feature_info in self.feature_patterns.items():
+            for match in feature_info[pattern_key].finditer(text):
+                yield feature_name, match.start(), match.end()
+    
+    def _scan_keyword_database(self, content):
+        """Find every keyword hit in ASCII bytes with the Hyperscan database.
+        
+        Returns lists of (start, alternative, end) tuples by feature name,
+        including hits that overlap.
+        """
+        feature_keywords = self._feature_keywords
+        hits = defaultdict(list)
+        
+        def on_match(keyword_id, _start, end, _flags, _context):
+            feature_name, alternative, keyword = feature_keywords[keyword_id]
+            hits[feature_name].append((end - len(keyword), alternative, end))
+        
+        self._keyword_database.scan(content, match_event_handler=on_match)
+        return hits
+    
+    def _scan_keyword_automaton(self, text):
+        """Find every keyword hit in lowercased text with the keyword automaton.
+        
+        Returns lists of (start, alternative, end) tuples by feature name,
+        including hits that overlap.
+        """
+        hits = defaultdict(list)
+        for last, features in self._keyword_automaton.iter(text):
+            for feature_name, alternative, length in features:
+                hits[feature_name].append((last - length + 1, alternative, last + 1))
+        return hits
+    
+    def _select_keyword_matches(self, hits):
+        """Reduce keyword hits to the matches the feature patterns would find."""
+        # Keep the hits re.finditer would: the leftmost, preferring the
+        # earlier alternative, then the next one starting after it ends
+        for feature_name in self.feature_patterns:
+            position = 0
+            for start, alternative, end in sorted(hits.get(feature_name, ())):
+                if start >= position:
+                    yield feature_name, start, end
+                    position = end
+    
+    def _scan_file(self, file_path, saturated=(), read=None):
+        """Find the feature occurrences in a file.
+        
+        Returns a (counts, occurrences) tuple: the number of occurrences of
+        each feature, and lists of the ones to store (at most
+        self.max_occurrences of each) as (file, line, match, context)
+        tuples, both by feature name. Features in
+        saturated already have all the occurrences that will be stored, so
+        they are only counted. read, if given, returns the file's contents
+        in place of reading it here. Returns None if the file was skipped or
+        could not be analyzed. This does not touch self.results, so it can
+        run in a worker process.
+        """
+        file_counts = defaultdict(int)
+        file_occurrences = defaultdict(list)
+        mapped = None
+        try:
+            content = read() if read is not None else _read_file(file_path)
+            
+            # Skip binary files
+            if is_binary(content):
+                if self.verbose:
+                    print(f"Skipping binary file {file_path}")
+                return None
+            
+            # A mapped file is scanned in place when it is ASCII without
+            # carriage returns and Hyperscan scans it as it is; otherwise it
+            # is copied out like a file that was read
+            if isinstance(content, mmap.mmap):
+                mapped = content
+                if self._keyword_database is None or content.find(b'\r') >= 0 or \
+                        NON_ASCII_RE.search(content) is not None:
+                    content = content[:]
+            
+            # ASCII files are scanned as bytes, and only the text kept from
+            # them is decoded; other files are decoded as a whole. Newlines
+            # are translated the way text mode would.
+            if content is mapped:
+                newline = b'\n'
+                decode = bytes.decode
+            elif content.isascii():
+                if b'\r' in content:
+                    content = content.replace(b'\r\n', b'\n').replace(b'\r', b'\n')
+                newline = b'\n'
+                decode = bytes.decode
+            else:
+                content = content.decode('utf-8')
+                if '\r' in content:
+                    content = content.replace('\r\n', '\n').replace('\r', '\n')
+                newline = '\n'
+                decode = str
+            
+            # Offsets of the newlines, so line numbers are found by bisection;
+            # only found once an occurrence is stored, since a file whose
+            # features are all saturated just has its matches counted
+            newlines = None
+            
+            # Occurrences are stored as tuples until the features are
+            # reported; the file name is interned so the occurrences in a
+            # file share one string
+            file_name = None
+            
+            # Check for feature patterns
+            max_occurrences = self.max_occurrences
+            for feature_name, start, end in self._find_feature_matches(content):
+                file_counts[feature_name] += 1
+                if feature_name in saturated or \
+                        (max_occurrences and len(file_occurrences[feature_name]) >= max_occurrences):
+                    continue
                 
-                # Check for feature patterns
-                for feature_name, feature_info in self.feature_patterns.items():
-                    pattern = feature_info['pattern']
+                if newlines is None:
+                    file_name = sys.intern(str(file_path))
                     
-                    for match in re.finditer(pattern, content, re.IGNORECASE):
-                        context_start = max(0, match.start() - 100)
-                        context_end = min(len(content), match.end() + 100)
-                        context = content[context_start:context_end]
-                        
-                        # Find the line number
-                        line_number = content[:match.start()].count('\n') + 1
-                        
-                        feature_occurrences[feature_name].append({
-                            'file': str(file_path),
-                            'line': line_number,
-                            'match': match.group(0),
-                            'context': context
-                        })
+                    # An array keeps the offsets unboxed, at 8 bytes each
+                    newlines = array('Q')
+                    index = content.find(newline)
+                    while index >= 0:
+                        newlines.append(index)
+                        index = content.find(newline, index + 1)
                 
-                if self.verbose:
-                    print(f"Analyzed {file_path}")
-            
-            except Exception as e:
-                print(f"Error analyzing {file_path}: {e}")
+                context_start = max(0, start - 100)
+                context_end = min(len(content), end + 100)
+                context = decode(content[context_start:context_end])
+                
+                file_occurrences[feature_name].append(
+                    (file_name, bisect_right(newlines, start) + 1, decode(content[start:end]), context))
+        
+        except Exception as e:
+            print(f"Error analyzing {file_path}: {e}")
+            return None
+        
+        finally:
+            if mapped is not None:
+                mapped.close()
+        
+        return file_counts, file_occurrences
+    
+    def _identify_features(self, files, jobs=1):
+        """Identify features in files."""
+        # Initialize feature occurrence counts and stored occurrences, and
+        # the features that have as many stored as will be kept
+        feature_counts = defaultdict(int)
+        feature_occurrences = defaultdict(list)
+        saturated = set()
+        
+        if jobs > 1 and len(files) >= PARALLEL_MIN_FILES:
+            scans = map_in_worker_processes(self, '_scan_file', files, jobs, max_occurrences=self.max_occurrences)
+            for file_path, scan in zip(files, scans):
+                self._add_file_occurrences(feature_counts, feature_occurrences, saturated, file_path, scan)
+        else:
+            # Scanned one at a time, later files skip building the
+            # occurrences of features that are already saturated
+            for file_path, read in self._iter_file_reads(files):
+                self._add_file_occurrences(feature_counts, feature_occurrences, saturated, file_path,
+                                           self._scan_file(file_path, saturated, read))
         
         # Process feature occurrences
-        for feature_name, occurrences in feature_occurrences.items():
-            # Skip features with too few occurrences (likely false positives)
-            if len(occurrences) < 3:
+        for feature_name, occurrence_count in feature_counts.items():
+            # Skip features with too few occurrences (likely false positives);
+            # a skipped feature has at most two stored occurrences, so their
+            # context is not worth deferring past the scan
+            if occurrence_count < 3:
                 continue
             
             # Get value factors for the feature
             value_factors = self.feature_patterns[feature_name]['value_factors']
             
             # Calculate implementation completeness based on occurrences
-            implementation_completeness = min(1.0, len(occurrences) / 20)  # Cap at 20 occurrences
+            implementation_completeness = min(1.0, occurrence_count / 20)  # Cap at 20 occurrences
             
             self.results['features'].append({
                 'name': feature_name,
-                'occurrences': occurrences,
-                'occurrence_count': len(occurrences),
+                'occurrences': [
+                    {'file': file_name, 'line': line, 'match': match, 'context': context}
+                    for file_name, line, match, context in feature_occurrences[feature_name]
+                ],
+                'occurrence_count': occurrence_count,
                 'value_factors': value_factors,
                 'implementation_completeness': implementation_completeness
             })
     
+    def _iter_file_reads(self, files):
+        """Read files ahead of their scan.
+        
+        Yields a (file path, read) pair for each file, in order, where read
+        returns the file's contents or raises the error that prevented
+        reading it. With liburing, and a kernel that allows io_uring, files
+        are read in batches with one submission each; otherwise, or from the
+        first batch io_uring does not take in full, they are read in
+        threads, overlapping with the scan.
+        """
+        uring = _open_uring(READ_AHEAD_FILES) if LIBURING_AVAILABLE else None
+        if uring is not None:
+            batch_start = 0
+            try:
+                while batch_start < len(files):
+                    batch = files[batch_start:batch_start + READ_AHEAD_FILES]
+                    results = _read_batch_uring(uring, batch)
+                    if results is None:
+                        # io_uring did not take the whole batch; it and the
+                        # files after it are read in threads instead
+                        break
+                    batch_start += len(batch)
+                    for file_path, result in zip(batch, results):
+                        yield file_path, _result_reader(result)
+            finally:
+                liburing.io_uring_queue_exit(uring[0])
+            files = files[batch_start:]
+        
+        with ThreadPoolExecutor(max_workers=READ_THREADS) as readers:
+            pending = iter(files)
+            reads = deque((file_path, readers.submit(_read_file, file_path))
+                          for file_path in islice(pending, READ_AHEAD_FILES))
+            
+            while reads:
+                file_path, read = reads.popleft()
+                for next_path in islice(pending, 1):
+                    reads.append((next_path, readers.submit(_read_file, next_path)))
+                yield file_path, read.result
+    
+    def _add_file_occurrences(self, feature_counts, feature_occurrences, saturated, file_path, scan):
+        """Add the feature occurrences found in a file by _scan_file to the totals.
+        
+        Features that reach self.max_occurrences stored are added to saturated.
+        """
+        if scan is None:
+            return
+        
+        file_counts, file_occurrences = scan
+        for feature_name, count in file_counts.items():
+            feature_counts[feature_name] += count
+        
+        max_occurrences = self.max_occurrences
+        for feature_name, occurrences in file_occurrences.items():
+            stored = feature_occurrences[feature_name]
+            if max_occurrences:
+                occurrences = occurrences[:max_occurrences - len(stored)]
+            stored.extend(occurrences)
+            if max_occurrences and len(stored) >= max_occurrences:
+                saturated.add(feature_name)
+        
+        if self.verbose:
+            print(f"Analyzed {file_path}")
+    
+    def _raw_value_score(self, value_factors):
+        """Calculate the value score of a feature's value factors, before adjustment."""
+        value_score = 0
+        
+        for factor, rating in value_factors.items():
+            weighted_scores = self._weighted_factor_scores.get(factor)
+            if weighted_scores is not None and rating in weighted_scores:
+                value_score += weighted_scores[rating]
+            else:
+                # Unknown factors have no weight; unknown ratings default to medium (3)
+                value_score += self.value_factor_weights.get(factor, 0) * self.value_factor_scores.get(rating, 3)
+        
+        return value_score
+    
     def _calculate_feature_values(self):
         """Calculate the value of each feature."""
+        raw_value_scores = self._raw_value_scores
         for feature in self.results['features']:
-            # Calculate raw value score
-            value_score = 0
-            
-            for factor, rating in feature['value_factors'].items():
-                factor_weight = self.value_factor_weights.get(factor, 0)
-                factor_score = self.value_factor_scores.get(rating, 3)  # Default to medium (3)
-                
-                value_score += factor_weight * factor_score
+            value_score = raw_value_scores[feature['name']]
             
             # Adjust for implementation completeness
             adjusted_value_score = value_score * (0.5 + 0.5 * feature['implementation_completeness'])
@@ -283,124 +650,227 @@ class FeatureValueAnalyzer:
     
     def _calculate_summary(self):
         """Calculate summary statistics."""
-        total_features = len(self.results['features'])
-        high_value_features = sum(1 for feature in self.results['features'] if feature['value_category'] == 'high')
-        medium_value_features = sum(1 for feature in self.results['features'] if feature['value_category'] == 'medium')
-        low_value_features = sum(1 for feature in self.results['features'] if feature['value_category'] == 'low')
+        # Group the features by value category in one pass
+        features_by_category = {'high': [], 'medium': [], 'low': []}
+        for feature in self.results['features']:
+            features_by_category[feature['value_category']].append(feature)
+        for features in features_by_category.values():
+            features.sort(key=lambda x: x['value_score'], reverse=True)
+        self._features_by_category = features_by_category
         
         self.results['summary'] = {
-            'total_features': total_features,
-            'high_value_features': high_value_features,
-            'medium_value_features': medium_value_features,
-            'low_value_features': low_value_features
+            'total_features': len(self.results['features']),
+            'high_value_features': len(features_by_category['high']),
+            'medium_value_features': len(features_by_category['medium']),
+            'low_value_features': len(features_by_category['low'])
         }
     
     def save_results(self, output_file, format='json'):
         """Save analysis results to a file."""
-        with open(output_file, 'w', encoding='utf-8') as f:
-            if format == 'json':
-                json.dump(self.results, f, indent=2)
-            elif format == 'yaml':
-                yaml.dump(self.results, f, sort_keys=False)
+        if format == 'json' and ORJSON_AVAILABLE:
+            with open(output_file, 'wb') as f:
+                f.write(orjson.dumps(self.results, option=orjson.OPT_INDENT_2))
+        else:
+            with open(output_file, 'w', encoding='utf-8') as f:
+                if format == 'json':
+                    json.dump(self.results, f, indent=2)
+                elif format == 'yaml':
+                    yaml.dump(self.results, f, Dumper=YamlDumper, sort_keys=False)
         
         print(f"Saved feature value analysis results to {output_file}")
     
     def generate_report(self, output_file):
         """Generate a human-readable report."""
-        with open(output_file, 'w', encoding='utf-8') as f:
-            f.write("# Feature Value Analysis Report\n\n")
-            
-            # Write summary
-            f.write("## Summary\n\n")
-            f.write(f"- Total features identified: {self.results['summary']['total_features']}\n")
-            f.write(f"- High-value features: {self.results['summary']['high_value_features']}\n")
-            f.write(f"- Medium-value features: {self.results['summary']['medium_value_features']}\n")
-            f.write(f"- Low-value features: {self.results['summary']['low_value_features']}\n\n")
-            
-            # Write high-value features
-            f.write("## High-Value Features\n\n")
-            
-            high_value_features = [feature for feature in self.results['features'] if feature['value_category'] == 'high']
-            high_value_features.sort(key=lambda x: x['value_score'], reverse=True)
-            
-            for feature in high_value_features:
-                f.write(f"### {feature['name'].capitalize()}\n\n")
-                f.write(f"- **Value Score**: {feature['value_score']:.2f}\n")
-                f.write(f"- **Occurrences**: {feature['occurrence_count']}\n")
-                f.write(f"- **Implementation Completeness**: {feature['implementation_completeness'] * 100:.0f}%\n\n")
-                
-                f.write("#### Value Factors\n\n")
-                for factor, rating in feature['value_factors'].items():
-                    f.write(f"- {factor.replace('_', ' ').capitalize()}: {rating}\n")
-                
-                f.write("\n#### Key Occurrences\n\n")
-                for occurrence in feature['occurrences'][:3]:  # Show top 3 occurrences
-                    f.write(f"- {occurrence['file']}:{occurrence['line']}\n")
-                
-                f.write("\n")
+        # Build the report in memory and write it in one call
+        parts = []
+        write = parts.append
+        
+        write("# Feature Value Analysis Report\n\n")
+        
+        # Write summary
+        write("## Summary\n\n")
+        write(f"- Total features identified: {self.results['summary']['total_features']}\n")
+        write(f"- High-value features: {self.results['summary']['high_value_features']}\n")
+        write(f"- Medium-value features: {self.results['summary']['medium_value_features']}\n")
+        write(f"- Low-value features: {self.results['summary']['low_value_features']}\n\n")
+        
+        # Write high-value features
+        write("## High-Value Features\n\n")
+        
+        high_value_features = self._features_by_category['high']
+        
+        for feature in high_value_features:
+            write(f"### {feature['name'].capitalize()}\n\n")
+            write(f"- **Value Score**: {feature['value_score']:.2f}\n")
+            write(f"- **Occurrences**: {feature['occurrence_count']}\n")
+            write(f"- **Implementation Completeness**: {feature['implementation_completeness'] * 100:.0f}%\n\n")
             
-            # Write medium-value features
-            f.write("## Medium-Value Features\n\n")
+            write("#### Value Factors\n\n")
+            for factor, rating in feature['value_factors'].items():
+                write(f"- {factor.replace('_', ' ').capitalize()}: {rating}\n")
             
-            medium_value_features = [feature for feature in self.results['features'] if feature['value_category'] == 'medium']
-            medium_value_features.sort(key=lambda x: x['value_score'], reverse=True)
+            write("\n#### Key Occurrences\n\n")
+            for occurrence in feature['occurrences'][:3]:  # Show top 3 occurrences
+                write(f"- {occurrence['file']}:{occurrence['line']}\n")
             
-            for feature in medium_value_features:
-                f.write(f"### {feature['name'].capitalize()}\n\n")
-                f.write(f"- **Value Score**: {feature['value_score']:.2f}\n")
-                f.write(f"- **Occurrences**: {feature['occurrence_count']}\n")
-                f.write(f"- **Implementation Completeness**: {feature['implementation_completeness'] * 100:.0f}%\n\n")
-                
-                f.write("#### Value Factors\n\n")
-                for factor, rating in feature['value_factors'].items():
-                    f.write(f"- {factor.replace('_', ' ').capitalize()}: {rating}\n")
-                
-                f.write("\n")
+            write("\n")
+        
+        # Write medium-value features
+        write("## Medium-Value Features\n\n")
+        
+        medium_value_features = self._features_by_category['medium']
+        
+        for feature in medium_value_features:
+            write(f"### {feature['name'].capitalize()}\n\n")
+            write(f"- **Value Score**: {feature['value_score']:.2f}\n")
+            write(f"- **Occurrences**: {feature['occurrence_count']}\n")
+            write(f"- **Implementation Completeness**: {feature['implementation_completeness'] * 100:.0f}%\n\n")
             
-            # Write low-value features
-            f.write("## Low-Value Features\n\n")
+            write("#### Value Factors\n\n")
+            for factor, rating in feature['value_factors'].items():
+                write(f"- {factor.replace('_', ' ').capitalize()}: {rating}\n")
             
-            low_value_features = [feature for feature in self.results['features'] if feature['value_category'] == 'low']
-            low_value_features.sort(key=lambda x: x['value_score'], reverse=True)
+            write("\n")
+        
+        # Write low-value features
+        write("## Low-Value Features\n\n")
+        
+        low_value_features = self._features_by_category['low']
+        
+        for feature in low_value_features:
+            write(f"### {feature['name'].capitalize()}\n\n")
+            write(f"- **Value Score**: {feature['value_score']:.2f}\n")
+            write(f"- **Occurrences**: {feature['occurrence_count']}\n\n")
+        
+        # Write recommendations
+        write("## Recommendations\n\n")
+        
+        # Recommend focusing on high-value features
+        if high_value_features:
+            write("### Focus on High-Value Features\n\n")
+            write("Consider prioritizing development efforts on these high-value features:\n\n")
             
-            for feature in low_value_features:
-                f.write(f"### {feature['name'].capitalize()}\n\n")
-                f.write(f"- **Value Score**: {feature['value_score']:.2f}\n")
-                f.write(f"- **Occurrences**: {feature['occurrence_count']}\n\n")
+            for feature in high_value_features[:3]:
+                write(f"1. **{feature['name'].capitalize()}** - Value Score: {feature['value_score']:.2f}\n")
             
-            # Write recommendations
-            f.write("## Recommendations\n\n")
+            write("\n")
+        
+        # Recommend improving medium-value features
+        if medium_value_features:
+            write("### Improve Medium-Value Features\n\n")
+            write("These features have potential but may need improvements to increase their value:\n\n")
             
-            # Recommend focusing on high-value features
-            if high_value_features:
-                f.write("### Focus on High-Value Features\n\n")
-                f.write("Consider prioritizing development efforts on these high-value features:\n\n")
-                
-                for feature in high_value_features[:3]:
-                    f.write(f"1. **{feature['name'].capitalize()}** - Value Score: {feature['value_score']:.2f}\n")
-                
-                f.write("\n")
+            for feature in medium_value_features[:3]:
+                write(f"1. **{feature['name'].capitalize()}** - Consider enhancing monetization potential\n")
             
-            # Recommend improving medium-value features
-            if medium_value_features:
-                f.write("### Improve Medium-Value Features\n\n")
-                f.write("These features have potential but may need improvements to increase their value:\n\n")
-                
-                for feature in medium_value_features[:3]:
-                    f.write(f"1. **{feature['name'].capitalize()}** - Consider enhancing monetization potential\n")
-                
-                f.write("\n")
+            write("\n")
+        
+        # Recommend reconsidering low-value features
+        if low_value_features:
+            write("### Reconsider Low-Value Features\n\n")
+            write("These features may not be worth significant investment:\n\n")
             
-            # Recommend reconsidering low-value features
-            if low_value_features:
-                f.write("### Reconsider Low-Value Features\n\n")
-                f.write("These features may not be worth significant investment:\n\n")
-                
-                for feature in low_value_features[:3]:
-                    f.write(f"1. **{feature['name'].capitalize()}** - Value Score: {feature['value_score']:.2f}\n")
+            for feature in low_value_features[:3]:
+                write(f"1. **{feature['name'].capitalize()}** - Value Score: {feature['value_score']:.2f}\n")
+        
+        with open(output_file, 'w', encoding='utf-8') as f:
+            f.write(''.join(parts))
         
         print(f"Generated feature value report at {output_file}")
 
+def _read_file(file_path):
+    """Return the contents of a file as bytes, or mapped if it is large."""
+    with open(file_path, 'rb') as f:
+        if os.fstat(f.fileno()).st_size >= MMAP_MIN_BYTES:
+            return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        return f.read()
+
+def _open_uring(depth):
+    """Set up an io_uring instance, returning (ring, cqe), or None if the kernel refuses."""
+    ring = liburing.Ring()
+    try:
+        if liburing.io_uring_queue_init(depth, ring):
+            return None
+    except OSError:
+        return None
+    return ring, liburing.Cqe()
+
+def _read_batch_uring(uring, file_paths):
+    """Read a batch of files with io_uring.
+    
+    The files are opened here, and all their reads are submitted at once;
+    large files are mapped instead of read. Returns a list with each file's
+    contents as bytes or a mapping, or the error that prevented reading it,
+    or None if not all the reads could be submitted.
+    """
+    ring, cqe = uring
+    results = [None] * len(file_paths)
+    buffers = {}
+    fds = []
+    # Indices of the files whose reads were submitted and not yet reaped;
+    # until they are, the kernel may still write into their buffers
+    pending = set()
+    try:
+        for i, file_path in enumerate(file_paths):
+            try:
+                fd = os.open(file_path, os.O_RDONLY)
+                fds.append(fd)
+                size = os.fstat(fd).st_size
+                if size >= MMAP_MIN_BYTES:
+                    results[i] = mmap.mmap(fd, 0, access=mmap.ACCESS_READ)
+                    continue
+            except (OSError, ValueError) as e:
+                results[i] = e
+                continue
+            
+            buffer = buffers[i] = bytearray(size)
+            sqe = liburing.io_uring_get_sqe(ring)
+            liburing.io_uring_prep_read(sqe, fd, buffer, 0)
+            liburing.io_uring_sqe_set_data64(sqe, i)
+        
+        if buffers:
+            try:
+                submitted = liburing.io_uring_submit(ring)
+            except OSError:
+                submitted = 0
+            # Submission queue entries are taken in the order they were added
+            pending.update(islice(buffers, submitted))
+            if submitted < len(buffers):
+                return None
+        
+        # Reap the completions one at a time; a read may come up short if
+        # the file was truncated after it was opened
+        while pending:
+            liburing.io_uring_wait_cqe(ring, cqe)
+            entry = cqe[0]
+            i = entry.user_data
+            pending.discard(i)
+            res = entry.res
+            if res < 0:
+                results[i] = OSError(-res, os.strerror(-res), file_paths[i])
+            else:
+                results[i] = bytes(buffers[i][:res])
+            liburing.io_uring_cq_advance(ring, 1)
+    finally:
+        # If the reads were not all reaped, because of a short submission or
+        # an exception, wait for the rest before their buffers and files go
+        while pending:
+            liburing.io_uring_wait_cqe(ring, cqe)
+            pending.discard(cqe[0].user_data)
+            liburing.io_uring_cq_advance(ring, 1)
+        for fd in fds:
+            os.close(fd)
+    
+    return results
+
+def _result_reader(result):
+    """Return a read callable for a result of _read_batch_uring."""
+    def read():
+        if isinstance(result, Exception):
+            raise result
+        return result
+    return read
+
 def main():
     parser = argparse.ArgumentParser(description="Analyze feature value")
     parser.add_argument("source_dir", help="Source directory to analyze")
@@ -409,11 +879,19 @@ def main():
     parser.add_argument("--report", help="Generate human-readable report")
     parser.add_argument("--exclude", nargs="+", default=["node_modules", "dist", "build", ".git"],
                         help="Patterns to exclude (default: node_modules dist build .git)")
+    parser.add_argument("--max-file-size", type=int, default=DEFAULT_MAX_FILE_BYTES,
+                        help=f"Skip files larger than this many bytes, 0 for no limit (default: {DEFAULT_MAX_FILE_BYTES})")
+    parser.add_argument("--max-occurrences", type=int, default=0,
+                        help="Store at most this many occurrences of each feature, 0 for no limit (default: 0); "
+                             "all of them are still counted")
+    parser.add_argument("--jobs", "-j", type=int, default=os.cpu_count() or 1,
+                        help="Number of worker processes used to scan files (default: number of CPUs)")
     parser.add_argument("--verbose", action="store_true", help="Enable verbose output")
     args = parser.parse_args()
     
-    analyzer = FeatureValueAnalyzer(verbose=args.verbose)
-    analyzer.analyze_directory(args.source_dir, exclude_patterns=args.exclude)
+    analyzer = FeatureValueAnalyzer(verbose=args.verbose, max_file_bytes=args.max_file_size,
+                                    max_occurrences=args.max_occurrences)
+    analyzer.analyze_directory(args.source_dir, exclude_patterns=args.exclude, jobs=args.jobs)
     analyzer.save_results(args.output, format=args.format)
     
     if args.report:
@@ -22,11 +22,25 @@ from pathlib import Path
 import yaml
 from collections import defaultdict
 
+try:
+    from .analysis_common import (PARALLEL_MIN_FILES, compile_ascii_pattern, is_binary, iter_file_paths,
+                                  map_in_worker_processes, path_pattern_excluder)
+except ImportError:
+    from analysis_common import (PARALLEL_MIN_FILES, compile_ascii_pattern, is_binary, iter_file_paths,
+                                 map_in_worker_processes, path_pattern_excluder)
+
+# File types that are analyzed
+ANALYZED_EXTENSIONS = ('.js', '.jsx', '.ts', '.tsx', '.py', '.json', '.md')
+
+# Files larger than this are skipped by default
+DEFAULT_MAX_FILE_BYTES = 10 * 1024 * 1024
+
 class PricingStrategyAnalyzer:
     """Analyzes the codebase to identify and suggest pricing strategies."""
     
-    def __init__(self, verbose=False):
+    def __init__(self, verbose=False, max_file_bytes=DEFAULT_MAX_FILE_BYTES):
         self.verbose = verbose
+        self.max_file_bytes = max_file_bytes
         self.results = {
             'pricing_elements': [],
             'pricing_models': [],
@@ -124,9 +138,29 @@ class PricingStrategyAnalyzer:
                 'cons': ['Need critical mass', 'Platform value must be clear', 'Competition may undercut fees']
             }
         }
+        
+        # Compile the patterns once; they are run on every file and every
+        # pricing element, and the pricing patterns also on lowercased ASCII
+        # files
+        self._compiled_pricing_patterns = {
+            pricing_type: re.compile(pattern, re.IGNORECASE)
+            for pricing_type, pattern in self.pricing_patterns.items()
+        }
+        self._ascii_pricing_patterns = {
+            pricing_type: compile_ascii_pattern(pattern)
+            for pricing_type, pattern in self.pricing_patterns.items()
+        }
+        self._compiled_pricing_models = {
+            model_name: [re.compile(pattern, re.IGNORECASE) for pattern in patterns]
+            for model_name, patterns in self.pricing_models.items()
+        }
     
-    def analyze_directory(self, directory_path, exclude_patterns=None):
-        """Analyze files in a directory to identify pricing-related code."""
+    def analyze_directory(self, directory_path, exclude_patterns=None, jobs=1):
+        """Analyze files in a directory to identify pricing-related code.
+        
+        With jobs > 1 and enough files, the files are analyzed in that many
+        worker processes; results are merged in the same order either way.
+        """
         if exclude_patterns is None:
             exclude_patterns = ['node_modules', 'dist', 'build', '.git']
         
@@ -136,17 +170,15 @@ class PricingStrategyAnalyzer:
             print(f"Error: {directory_path} is not a directory")
             return
         
-        # Walk through the directory
-        for root, dirs, files in os.walk(directory_path):
-            # Skip excluded directories
-            dirs[:] = [d for d in dirs if not any(pattern in str(Path(root) / d) for pattern in exclude_patterns)]
-            
-            for file in files:
-                file_path = Path(root) / file
-                
-                # Only process relevant file types
-                if file.endswith(('.js', '.jsx', '.ts', '.tsx', '.py', '.json', '.md')):
-                    self._analyze_file(file_path)
+        # Collect the files to analyze; exclude patterns may match anywhere
+        # in a directory's path
+        top_directory = str(directory_path)
+        file_paths = list(iter_file_paths(top_directory, path_pattern_excluder(top_directory, exclude_patterns),
+                                          lambda name: name.endswith(ANALYZED_EXTENSIONS),
+                                          self.max_file_bytes, self.verbose))
+        
+        # Find pricing elements
+        self._analyze_files(file_paths, jobs=jobs)
         
         # Identify pricing models
         self._identify_pricing_models()
@@ -157,30 +189,83 @@ class PricingStrategyAnalyzer:
         # Calculate summary
         self._calculate_summary()
     
+    def _analyze_files(self, file_paths, jobs=1):
+        """Find the pricing elements in files, in file order."""
+        pricing_elements = self.results['pricing_elements']
+        
+        if jobs > 1 and len(file_paths) >= PARALLEL_MIN_FILES:
+            for elements in map_in_worker_processes(self, '_analyze_file', file_paths, jobs, verbose=self.verbose):
+                pricing_elements.extend(elements)
+        else:
+            for file_path in file_paths:
+                pricing_elements.extend(self._analyze_file(file_path))
+    
     def _analyze_file(self, file_path):
-        """Analyze a file for pricing-related code."""
+        """Analyze a file for pricing-related code.
+        
+        Returns the pricing elements found in the file, an empty list if it
+        could not be analyzed. This does not touch self.results, so it can
+        run in a worker process.
+        """
+        pricing_elements = []
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
+            with open(file_path, 'rb') as f:
                 content = f.read()
             
+            # Skip binary files
+            if is_binary(content):
+                if self.verbose:
+                    print(f"Skipping binary file {file_path}")
+                return []
+            
+            # ASCII files are lowercased once and matched case-sensitively as
+            # bytes; lowercasing them keeps every offset, so matches are
+            # sliced from content and only those slices are decoded. Other
+            # files are decoded as a whole and matched case-insensitively.
+            # Newlines are translated the way text mode would.
+            if content.isascii():
+                if b'\r' in content:
+                    content = content.replace(b'\r\n', b'\n').replace(b'\r', b'\n')
+                text = content.lower()
+                patterns = self._ascii_pricing_patterns
+                newline = b'\n'
+                decode = bytes.decode
+            else:
+                content = content.decode('utf-8')
+                if '\r' in content:
+                    content = content.replace('\r\n', '\n').replace('\r', '\n')
+                text = content
+                patterns = self._compiled_pricing_patterns
+                newline = '\n'
+                decode = str
+            
+            file_name = str(file_path)
+            
             # Check for pricing patterns
-            for pricing_type, pattern in self.pricing_patterns.items():
-                for match in re.finditer(pattern, content, re.IGNORECASE):
-                    context_start = max(0, match.start() - 100)
-                    context_end = min(len(content), match.end() + 100)
-                    context = content[context_start:context_end]
+            for pricing_type, pattern in patterns.items():
+                # Matches come in file order, so line numbers are counted on
+                # from the previous match rather than from the start
+                line_number = 1
+                position = 0
+                
+                for match in pattern.finditer(text):
+                    start, end = match.span()
+                    context_start = max(0, start - 100)
+                    context_end = min(len(content), end + 100)
+                    context = decode(content[context_start:context_end])
                     
                     # Find the line number
-                    line_number = content[:match.start()].count('\n') + 1
+                    line_number += content.count(newline, position, start)
+                    position = start
                     
                     # Extract the value
-                    value = match.group(2) if match.lastindex >= 2 else None
+                    value = decode(content[match.start(2):match.end(2)]) if match.lastindex >= 2 else None
                     
-                    self.results['pricing_elements'].append({
+                    pricing_elements.append({
                         'type': pricing_type,
-                        'file': str(file_path),
+                        'file': file_name,
                         'line': line_number,
-                        'match': match.group(0),
+                        'match': decode(content[start:end]),
                         'value': value,
                         'context': context
                     })
@@ -190,17 +275,20 @@ class PricingStrategyAnalyzer:
         
         except Exception as e:
             print(f"Error analyzing {file_path}: {e}")
+            return []
+        
+        return pricing_elements
     
     def _identify_pricing_models(self):
         """Identify pricing models based on pricing elements."""
         # Check for each pricing model
-        for model_name, patterns in self.pricing_models.items():
+        for model_name, patterns in self._compiled_pricing_models.items():
             evidence = []
             
             # Check all pricing elements for evidence of this model
             for element in self.results['pricing_elements']:
                 for pattern in patterns:
-                    if re.search(pattern, element['context'], re.IGNORECASE):
+                    if pattern.search(element['context']):
                         evidence.append({
                             'element': element['type'],
                             'file': element['file'],
@@ -473,11 +561,15 @@ def main():
     parser.add_argument("--report", help="Generate human-readable report")
     parser.add_argument("--exclude", nargs="+", default=["node_modules", "dist", "build", ".git"],
                         help="Patterns to exclude (default: node_modules dist build .git)")
+    parser.add_argument("--max-file-size", type=int, default=DEFAULT_MAX_FILE_BYTES,
+                        help=f"Skip files larger than this many bytes, 0 for no limit (default: {DEFAULT_MAX_FILE_BYTES})")
+    parser.add_argument("--jobs", "-j", type=int, default=os.cpu_count() or 1,
+                        help="Number of worker processes used to analyze files (default: number of CPUs)")
     parser.add_argument("--verbose", action="store_true", help="Enable verbose output")
     args = parser.parse_args()
     
-    analyzer = PricingStrategyAnalyzer(verbose=args.verbose)
-    analyzer.analyze_directory(args.source_dir, exclude_patterns=args.exclude)
+    analyzer = PricingStrategyAnalyzer(verbose=args.verbose, max_file_bytes=args.max_file_size)
+    analyzer.analyze_directory(args.source_dir, exclude_patterns=args.exclude, jobs=args.jobs)
     analyzer.save_results(args.output, format=args.format)
     
     if args.report: